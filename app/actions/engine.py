@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import replace
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from app.midi import ControlProfile, ControlProfileStore, MidiEvent
 from app.nodes import Node, NodeGraph
@@ -39,14 +39,37 @@ class ActionEngine:
             "action.shortcut": ShortcutAction(),
             "action.sound": SoundAction(),
         }
+        self._revision: Tuple[int, int] = (-1, -1)
+        self._input_nodes: Tuple[Node, ...] = ()
+        self._root_nodes: Tuple[Node, ...] = ()
+        self.refresh_if_stale()
 
     def set_profile_store(self, store: ControlProfileStore) -> None:
         self._profile_store = store
+        self._revision = (-1, -1)
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Rebuild the cached dispatch tables when the graph or profile store has
+        changed since the last build. Returns ``True`` when a rebuild happened.
+        """
+
+        revision = (self._graph.revision, self._profile_store.revision)
+        if revision == self._revision:
+            return False
+
+        nodes = tuple(self._graph.nodes().values())
+        self._input_nodes = tuple(node for node in nodes if node.type == "midi.input")
+        self._root_nodes = tuple(node for node in nodes if not self._graph.incoming(node.id))
+        self._revision = revision
+        return True
 
     def handle_event(self, event: MidiEvent) -> tuple[Node, ...]:
         if self._graph.is_empty():
             return tuple()
 
+        self.refresh_if_stale()
+
         matching_profiles = {
             profile.id: profile
             for profile in self._profile_store
@@ -58,9 +81,7 @@ class ActionEngine:
 
         dispatched = False
         triggered_inputs: list[Node] = []
-        for node in self._graph.nodes().values():
-            if node.type != "midi.input":
-                continue
+        for node in self._input_nodes:
             if not self._node_accepts_event(node, event, matching_profiles):
                 continue
             dispatched = True
@@ -75,9 +96,7 @@ class ActionEngine:
 
         if not dispatched:
             # Fallback to any nodes without incoming connections that accept the event.
-            for node in self._graph.nodes().values():
-                if self._graph.incoming(node.id):
-                    continue
+            for node in self._root_nodes:
                 if not self._node_accepts_event(node, event, matching_profiles):
                     continue
                 dispatched = True
@@ -45,6 +45,15 @@ class ControlProfileStore:
 
     def __init__(self) -> None:
         self._profiles: Dict[str, ControlProfile] = {}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter bumped whenever profiles are added, removed or reloaded.
+        """
+
+        return self._revision
 
     def add_from_event(
         self,
@@ -68,16 +77,19 @@ class ControlProfileStore:
             aliases=event.aliases,
         )
         self._profiles[profile.id] = profile
+        self._revision += 1
         return profile
 
     def add_profile(self, profile: ControlProfile) -> None:
         self._profiles[profile.id] = profile
+        self._revision += 1
 
     def get(self, profile_id: str) -> Optional[ControlProfile]:
         return self._profiles.get(profile_id)
 
     def remove(self, profile_id: str) -> None:
         self._profiles.pop(profile_id, None)
+        self._revision += 1
 
     def profiles(self) -> List[ControlProfile]:
         return list(self._profiles.values())
@@ -90,6 +102,7 @@ class ControlProfileStore:
 
     def clear(self) -> None:
         self._profiles.clear()
+        self._revision += 1
 
     def serialize(self) -> List[Dict[str, object]]:
         payload: List[Dict[str, object]] = []
@@ -127,6 +140,7 @@ class ControlProfileStore:
             except KeyError:
                 continue
             self._profiles[profile.id] = profile
+        self._revision += 1
 
     def _coerce_optional_int(self, value: object) -> Optional[int]:
         if value is None or value == "":
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import AbstractSet, Dict, Iterable, List, Optional, Set, Tuple
 
 from .base import Node, NodePort, NodePortDirection
 
+ConnectionKey = Tuple[str, str, str, str]  # source node/port, target node/port
+
 
 @dataclass
 class NodeConnection:
@@ -33,20 +35,35 @@ class NodeGraph:
     def __init__(self) -> None:
         self._nodes: Dict[str, Node] = {}
         self._connections: List[NodeConnection] = []
+        self._connection_keys: Set[ConnectionKey] = set()
         self._groups: Dict[str, NodeGroup] = {}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter bumped on every structural change (nodes, connections, groups).
+        """
+
+        return self._revision
 
     def add_node(self, node: Node) -> None:
         node.config.setdefault("position", (0.0, 0.0))
         self._nodes[node.id] = node
+        self._revision += 1
 
     def remove_node(self, node_id: str) -> None:
         self._nodes.pop(node_id, None)
+        self._revision += 1
         self._connections = [
             connection
             for connection in self._connections
             if connection.source_node != node_id
             and connection.target_node != node_id
         ]
+        self._connection_keys = {
+            key for key in self._connection_keys if key[0] != node_id and key[2] != node_id
+        }
         groups_to_remove: List[str] = []
         for group in self._groups.values():
             if node_id in group.node_ids:
@@ -120,6 +137,8 @@ class NodeGraph:
 
         connection = NodeConnection(source_node, source_port, target_node, target_port)
         self._connections.append(connection)
+        self._connection_keys.add((source_node, source_port, target_node, target_port))
+        self._revision += 1
         return True
 
     def disconnect(
@@ -139,6 +158,8 @@ class NodeGraph:
                 and connection.target_port == target_port
             )
         ]
+        self._connection_keys.discard((source_node, source_port, target_node, target_port))
+        self._revision += 1
 
     def disconnect_connection(self, connection: NodeConnection) -> None:
         self.disconnect(
@@ -174,9 +195,11 @@ class NodeGraph:
     def add_group(self, group: NodeGroup) -> None:
         self._groups[group.id] = group
         self._normalize_group_members(group.id)
+        self._revision += 1
 
     def remove_group(self, group_id: str) -> None:
         self._groups.pop(group_id, None)
+        self._revision += 1
 
     def get_group(self, group_id: str) -> Optional[NodeGroup]:
         return self._groups.get(group_id)
@@ -191,6 +214,7 @@ class NodeGraph:
         if group is not None:
             group.node_ids = list(dict.fromkeys(str(node_id) for node_id in node_ids))
             self._normalize_group_members(group_id)
+            self._revision += 1
 
     def set_group_rect(self, group_id: str, x: float, y: float, width: float, height: float) -> None:
         group = self._groups.get(group_id)
@@ -212,6 +236,14 @@ class NodeGraph:
     def connections(self) -> Tuple[NodeConnection, ...]:
         return tuple(self._connections)
 
+    def connection_keys(self) -> AbstractSet[ConnectionKey]:
+        """
+        Live, read-only view of ``(source_node, source_port, target_node,
+        target_port)`` tuples for every connection, maintained incrementally.
+        """
+
+        return self._connection_keys
+
     def outgoing(self, node_id: str) -> Tuple[NodeConnection, ...]:
         return tuple(
             connection
@@ -271,6 +303,13 @@ class NodeGraph:
         if node is not None:
             node.config["position"] = (float(x), float(y))
 
+    def set_node_positions(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        nodes = self._nodes
+        for node_id, (x, y) in positions.items():
+            node = nodes.get(node_id)
+            if node is not None:
+                node.config["position"] = (float(x), float(y))
+
     def node_position(self, node_id: str) -> Optional[Tuple[float, float]]:
         node = self._nodes.get(node_id)
         if node is not None:
@@ -287,7 +326,9 @@ class NodeGraph:
     def clear(self) -> None:
         self._nodes.clear()
         self._connections.clear()
+        self._connection_keys.clear()
         self._groups.clear()
+        self._revision += 1
 
     def _is_compatible(self, source: NodePort, target: NodePort) -> bool:
         if source.data_type == "any" or target.data_type == "any":
@@ -86,7 +86,11 @@ class WorkspaceStore:
             node.title = str(node_payload.get("title", node.title))
             config = node_payload.get("config", {})
             if isinstance(config, dict):
-                node.config.update(config)
+                node.config.update(
+                    (key, value)
+                    for key, value in config.items()
+                    if not str(key).startswith("_display_last_")
+                )
 
             graph.add_node(node)
 
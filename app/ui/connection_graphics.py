@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
-from PySide6.QtCore import QPointF, Qt
-from PySide6.QtGui import QColor, QPainterPath, QPen
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QPainterPath, QPainterPathStroker, QPen
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsPathItem
 
+from .spatial_index import GridIndex
+
+ConnectionKey = Tuple[str, str, str, str]  # source node, source port, target node, target port
+
+
+def connection_path(start: QPointF, end: QPointF) -> QPainterPath:
+    path = QPainterPath(start)
+    dx = max(abs(end.x() - start.x()) * 0.5, 60.0)
+    ctrl1 = QPointF(start.x() + dx, start.y())
+    ctrl2 = QPointF(end.x() - dx, end.y())
+    path.cubicTo(ctrl1, ctrl2, end)
+    return path
+
 
 class ConnectionGraphicsItem(QGraphicsPathItem):
     """
     Visual cable between two node ports.
+
+    Scene connections only get one of these while hovered or selected; idle
+    cables are drawn by the scene's ``ConnectionsLayerItem``.
     """
 
     NORMAL_PEN = QPen(QColor("#7aa2f7"), 2.0)
@@ -25,6 +41,7 @@ class ConnectionGraphicsItem(QGraphicsPathItem):
         super().__init__(parent)
         self._source = source
         self._target = target
+        self._hovered = False
 
         self.setPen(self.NORMAL_PEN)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
@@ -42,21 +59,25 @@ class ConnectionGraphicsItem(QGraphicsPathItem):
     def set_target(self, target: Optional[Tuple[str, str]]) -> None:
         self._target = target
 
+    @property
+    def hovered(self) -> bool:
+        return self._hovered
+
     def update_path(self, start: QPointF, end: QPointF) -> None:
-        path = QPainterPath(start)
-        dx = max(abs(end.x() - start.x()) * 0.5, 60.0)
-        ctrl1 = QPointF(start.x() + dx, start.y())
-        ctrl2 = QPointF(end.x() - dx, end.y())
-        path.cubicTo(ctrl1, ctrl2, end)
-        self.setPath(path)
+        self.setPath(connection_path(start, end))
 
     def hoverEnterEvent(self, event) -> None:  # type: ignore[override]
+        self._hovered = True
         self.setPen(self.HOVER_PEN)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event) -> None:  # type: ignore[override]
+        self._hovered = False
         self.setPen(self.SELECTED_PEN if self.isSelected() else self.NORMAL_PEN)
         super().hoverLeaveEvent(event)
+        scene = self.scene()
+        if scene is not None and self._target is not None and hasattr(scene, "queue_connection_idle"):
+            scene.queue_connection_idle((*self._source, *self._target))
 
     def setSelected(self, selected: bool) -> None:  # type: ignore[override]
         super().setSelected(selected)
@@ -65,3 +86,135 @@ class ConnectionGraphicsItem(QGraphicsPathItem):
         else:
             self.setPen(self.NORMAL_PEN)
 
+
+class ConnectionsLayerItem(QGraphicsItem):
+    """
+    Draws every idle connection with a single pen and one ``drawPath`` call.
+
+    Idle connections have no item of their own; the layer keeps their paths
+    in a grid index for painting only the exposed ones and for hit-testing,
+    so the scene can promote a cable to a ``ConnectionGraphicsItem`` when it
+    is hovered or selected.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._paths: Dict[ConnectionKey, QPainterPath] = {}
+        self._rects: Dict[ConnectionKey, QRectF] = {}
+        self._index = GridIndex()
+        self._bounds = QRectF()
+        self._bounds_stale = False
+        self._margin = ConnectionGraphicsItem.NORMAL_PEN.widthF()
+        self._stroker = QPainterPathStroker(ConnectionGraphicsItem.NORMAL_PEN)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setAcceptHoverEvents(False)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOptions, True)
+        self.setZValue(1)
+
+    def path(self, key: ConnectionKey) -> Optional[QPainterPath]:
+        return self._paths.get(key)
+
+    def set_path(self, key: ConnectionKey, path: QPainterPath) -> None:
+        previous_rect = self._rects.get(key)
+        rect = self._padded(path.controlPointRect())
+        self._paths[key] = path
+        self._rects[key] = rect
+        self._index.insert(key, rect)
+        if previous_rect is not None and self._on_edge(previous_rect):
+            # The old path may have defined the bounds; let them shrink.
+            self._invalidate_bounds()
+        elif not self._bounds_stale and not self._bounds.contains(rect):
+            self.prepareGeometryChange()
+            self._bounds = self._bounds.united(rect)
+        if previous_rect is not None:
+            rect = rect.united(previous_rect)
+        self.update(rect)
+
+    def remove(self, key: ConnectionKey) -> None:
+        if self._paths.pop(key, None) is None:
+            return
+        rect = self._rects.pop(key)
+        self._index.remove(key)
+        if not self._paths or self._on_edge(rect):
+            self._invalidate_bounds()
+        self.update(rect)
+
+    def clear(self) -> None:
+        self.prepareGeometryChange()
+        self._paths.clear()
+        self._rects.clear()
+        self._index.clear()
+        self._bounds = QRectF()
+        self._bounds_stale = False
+
+    def key_at(self, pos: QPointF) -> Optional[ConnectionKey]:
+        """
+        Return the idle connection whose stroke contains ``pos``; the stroke
+        matches the shape of a promoted item, so hover lands on it.
+        """
+
+        probe = QRectF(pos.x() - 0.5, pos.y() - 0.5, 1.0, 1.0)
+        for key in self._index.intersection(probe):
+            if self._rects[key].contains(pos) and self._stroker.createStroke(self._paths[key]).contains(pos):
+                return key
+        return None
+
+    def keys_in(self, rect: QRectF) -> Set[ConnectionKey]:
+        """
+        Return the idle connections whose stroke intersects ``rect``.
+        """
+
+        stroker = self._stroker
+        return {
+            key
+            for key in self._index.intersection(rect)
+            if self._rects[key].intersects(rect) and stroker.createStroke(self._paths[key]).intersects(rect)
+        }
+
+    def boundingRect(self) -> QRectF:  # type: ignore[override]
+        if self._bounds_stale:
+            bounds = QRectF()
+            for rect in self._rects.values():
+                bounds = bounds.united(rect)
+            self._bounds = bounds
+            self._bounds_stale = False
+        return self._bounds
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        _ = widget
+        exposed = option.exposedRect
+        rects = self._rects
+        paths = self._paths
+        combined = QPainterPath()
+        for key in self._index.intersection(exposed):
+            if rects[key].intersects(exposed):
+                combined.addPath(paths[key])
+        if combined.isEmpty():
+            return
+        painter.setPen(ConnectionGraphicsItem.NORMAL_PEN)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(combined)
+
+    def _invalidate_bounds(self) -> None:
+        """
+        Mark the bounds for a rebuild on the next ``boundingRect`` query, so a
+        burst of path updates during a drag costs one pass over the paths.
+        """
+
+        if self._bounds_stale:
+            return
+        self.prepareGeometryChange()
+        self._bounds_stale = True
+
+    def _on_edge(self, rect: QRectF) -> bool:
+        bounds = self._bounds
+        return (
+            rect.left() <= bounds.left()
+            or rect.top() <= bounds.top()
+            or rect.right() >= bounds.right()
+            or rect.bottom() >= bounds.bottom()
+        )
+
+    def _padded(self, rect: QRectF) -> QRectF:
+        margin = self._margin
+        return rect.adjusted(-margin, -margin, margin, margin)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Deque, Dict, Iterable, List, Optional, Set
 
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QAction, QActionGroup, QIcon, QColor, QPalette
 from PySide6.QtWidgets import (
     QApplication,
@@ -35,11 +37,38 @@ from .node_inspector import NodeInspector
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _MidiHotState:
+    """
+    Window state read on every incoming MIDI event.
+    """
+
+    active_device_ids: Set[str] = field(default_factory=set)
+    pending_learn: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _Shadow:
+    """
+    Last value shown on a MIDI input node's indicator. Kept out of
+    ``node.config`` so it never ends up in saved workspaces.
+    """
+
+    value: Optional[float] = None
+    active: bool = False
+    raw: Optional[int] = None
+
+
 class MainWindow(QMainWindow):
     """
     Top-level window for the Midas application.
     """
 
+    MIDI_QUEUE_SIZE = 4096
+    MIDI_DRAIN_BATCH = 64
+
+    _midiQueueReady = Signal()
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Midas")
@@ -67,17 +96,28 @@ class MainWindow(QMainWindow):
         self._last_workspace_dir: Path = Path.home()
         self._default_workspace_path: Path = Path.home() / ".config" / "midas" / "workspace.json"
         self._default_workspace_path.parent.mkdir(parents=True, exist_ok=True)
+        self._open_dialog: Optional[QFileDialog] = None
+        self._save_dialog: Optional[QFileDialog] = None
         self._status_bar = self.statusBar()
         self._status_bar.showMessage("Ready")
 
         self._theme: str = "light"
         self._theme_actions: Dict[str, QAction] = {}
 
-        self._active_device_ids: Set[str] = set()
-        self._suppress_selection_updates = False
-        self._pending_learn: Optional[str] = None
+        self._hot = _MidiHotState()
+        self._device_by_port: Dict[str, MidiDevice] = {}
+        self._display_state: Dict[str, _Shadow] = {}
         self._workspace_dirty = False
 
+        # MIDI callbacks arrive on the backend thread; they are buffered here and
+        # drained on the GUI thread in batches instead of one queued call each.
+        self._midi_queue: Deque[MidiEvent] = deque(maxlen=self.MIDI_QUEUE_SIZE)
+        self._midi_drain_pending = False
+        self._midi_drain_timer = QTimer(self)
+        self._midi_drain_timer.setSingleShot(True)
+        self._midi_drain_timer.setInterval(1)
+        self._midi_drain_timer.timeout.connect(self._drain_midi_events)
+
         self._setup_ui()
         self._setup_menus()
         self._setup_midi()
@@ -102,9 +142,11 @@ class MainWindow(QMainWindow):
         layout.addWidget(splitter)
         self.setCentralWidget(container)
 
-        self._node_editor.selectionChanged.connect(self._on_node_selection_changed)
-        self._node_editor.connectionCreated.connect(lambda _c: self._mark_workspace_dirty())
-        self._node_editor.connectionDeleted.connect(lambda _c: self._mark_workspace_dirty())
+        # Editor notifications are queued so edits in the canvas return to the
+        # event loop before the inspector and workspace state react.
+        self._node_editor.selectionChanged.connect(self._on_node_selection_changed, Qt.QueuedConnection)
+        self._node_editor.connectionCreated.connect(self._mark_workspace_dirty, Qt.QueuedConnection)
+        self._node_editor.connectionDeleted.connect(self._mark_workspace_dirty, Qt.QueuedConnection)
         self._node_inspector.learnRequested.connect(self._on_learn_requested)
         self._node_inspector.profileAssigned.connect(self._on_profile_assigned)
         self._node_inspector.deviceFilterChanged.connect(self._on_device_filter_changed)
@@ -179,7 +221,8 @@ class MainWindow(QMainWindow):
         self._device_panel.createVirtualRequested.connect(self._create_virtual_source)
         self._device_panel.removeVirtualRequested.connect(self._remove_virtual_source)
 
-        self._midi_controller.message_received.connect(self._handle_midi_event)
+        self._midiQueueReady.connect(self._schedule_midi_drain, Qt.QueuedConnection)
+        self._midi_controller.message_received.connect(self._enqueue_event, Qt.DirectConnection)
         self._midi_controller.devices_changed.connect(self._on_midi_devices_changed)
         self._midi_controller.error.connect(self._on_midi_error)
         self._midi_controller.stopped.connect(self._on_midi_stopped)
@@ -188,16 +231,14 @@ class MainWindow(QMainWindow):
         self._refresh_devices()
 
     def _open_workspace(self) -> None:
-        file_name, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open Workspace",
-            str(self._last_workspace_dir),
-            "Workspace Files (*.json)",
-        )
-        if not file_name:
+        dialog = self._workspace_open_dialog()
+        if not dialog.exec():
+            return
+        selected = dialog.selectedFiles()
+        if not selected:
             return
 
-        path = Path(file_name)
+        path = Path(selected[0])
         try:
             payload = self._workspace_store.load(path)
         except Exception as exc:  # pragma: no cover - disk I/O
@@ -213,7 +254,7 @@ class MainWindow(QMainWindow):
 
         self._workspace_path = path
         self._last_workspace_dir = path.parent
-        self._active_device_ids = {str(port) for port in info.get("active_devices", [])}
+        self._hot.active_device_ids = {str(port) for port in info.get("active_devices", [])}
         self._workspace_dirty = False
         self._reload_graph()
         self._refresh_devices()
@@ -226,22 +267,43 @@ class MainWindow(QMainWindow):
             self._workspace_dirty = False
 
     def _save_workspace_as(self) -> None:
-        file_name, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Workspace As",
-            str(self._last_workspace_dir / "workspace.json"),
-            "Workspace Files (*.json)",
-        )
-        if not file_name:
+        dialog = self._workspace_save_dialog()
+        if not dialog.exec():
+            return
+        selected = dialog.selectedFiles()
+        if not selected:
             return
 
-        path = Path(file_name)
+        path = Path(selected[0])
         if path.suffix.lower() != ".json":
             path = path.with_suffix(".json")
 
         if self._save_to_path(path, update_workspace_path=True):
             self._workspace_dirty = False
 
+    def _workspace_open_dialog(self) -> QFileDialog:
+        if self._open_dialog is None:
+            dialog = QFileDialog(
+                self, "Open Workspace", str(self._last_workspace_dir), "Workspace Files (*.json)"
+            )
+            dialog.setAcceptMode(QFileDialog.AcceptOpen)
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            self._open_dialog = dialog
+        self._open_dialog.setDirectory(str(self._last_workspace_dir))
+        return self._open_dialog
+
+    def _workspace_save_dialog(self) -> QFileDialog:
+        if self._save_dialog is None:
+            dialog = QFileDialog(
+                self, "Save Workspace As", str(self._last_workspace_dir), "Workspace Files (*.json)"
+            )
+            dialog.setAcceptMode(QFileDialog.AcceptSave)
+            dialog.setFileMode(QFileDialog.AnyFile)
+            self._save_dialog = dialog
+        self._save_dialog.setDirectory(str(self._last_workspace_dir))
+        self._save_dialog.selectFile("workspace.json")
+        return self._save_dialog
+
     def _show_about_dialog(self) -> None:
         QMessageBox.information(
             self,
@@ -329,6 +391,7 @@ class MainWindow(QMainWindow):
         )
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._node_inspector.flush_pending_edits()
         self._auto_save_workspace()
         self._midi_controller.stop()
         super().closeEvent(event)
@@ -336,16 +399,18 @@ class MainWindow(QMainWindow):
     @Slot()
     def _refresh_devices(self) -> None:
         devices = self._midi_manager.list_input_devices()
-        self._suppress_selection_updates = True
-        self._device_panel.set_devices(devices)
+        by_port = {device.port: device for device in devices}
+        self._device_by_port = by_port
 
-        selected_devices = [device for device in devices if device.port in self._active_device_ids]
+        active_ids = self._hot.active_device_ids
+        selected_devices = [device for device in devices if device.port in active_ids]
         if not selected_devices and devices:
             default_device = next((device for device in devices if not device.is_virtual), devices[0])
             selected_devices = [default_device]
 
-        self._device_panel.set_active_devices(selected_devices)
-        self._suppress_selection_updates = False
+        with QSignalBlocker(self._device_panel):
+            self._device_panel.set_devices(devices)
+            self._device_panel.set_active_devices(selected_devices)
         self._apply_device_selection(selected_devices, update_panel=False)
         self._node_inspector.refresh()
 
@@ -355,7 +420,7 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def _on_learn_requested(self, node_id: str) -> None:
-        self._pending_learn = node_id
+        self._hot.pending_learn = node_id
         self._status_bar.showMessage("Learning control: move the desired knob, fader, or button…")
         self._device_panel.set_status("Learning… move the desired control.")
 
@@ -372,6 +437,7 @@ class MainWindow(QMainWindow):
         else:
             node.config.pop("profile_id", None)
             node.config.pop("control_type", None)
+        self._node_editor.refresh_node_display(node_id)
         self._node_inspector.refresh()
         self._workspace_dirty = True
 
@@ -395,11 +461,10 @@ class MainWindow(QMainWindow):
         self._workspace_dirty = True
 
     def _apply_device_selection(self, devices: List[MidiDevice], update_panel: bool = True) -> None:
-        self._active_device_ids = {device.port for device in devices}
+        self._hot.active_device_ids = {device.port for device in devices}
         if update_panel:
-            self._suppress_selection_updates = True
-            self._device_panel.set_active_devices(devices)
-            self._suppress_selection_updates = False
+            with QSignalBlocker(self._device_panel):
+                self._device_panel.set_active_devices(devices)
 
         if devices:
             self._device_panel.set_status(
@@ -412,8 +477,6 @@ class MainWindow(QMainWindow):
 
     @Slot(object)
     def _on_device_selection_changed(self, devices: List[MidiDevice]) -> None:
-        if self._suppress_selection_updates:
-            return
         self._apply_device_selection(devices, update_panel=False)
         self._workspace_dirty = True
 
@@ -423,7 +486,7 @@ class MainWindow(QMainWindow):
         if device is None:
             QMessageBox.warning(self, "Virtual Source", "Unable to create virtual source.")
             return
-        self._active_device_ids = {device.port}
+        self._hot.active_device_ids = {device.port}
         self._status_bar.showMessage(f"Virtual source '{device.name}' created.", 4000)
         self._refresh_devices()
         self._workspace_dirty = True
@@ -434,18 +497,17 @@ class MainWindow(QMainWindow):
             return
         self._midi_manager.remove_virtual_device(device_id)
         removed_name = device.name
-        if device_id in self._active_device_ids:
-            self._active_device_ids.discard(device_id)
+        if device_id in self._hot.active_device_ids:
+            self._hot.active_device_ids.discard(device_id)
         self._status_bar.showMessage(f"Virtual source '{removed_name}' removed.", 4000)
         self._refresh_devices()
         self._workspace_dirty = True
 
     @Slot(object)
     def _on_midi_devices_changed(self, devices: List[MidiDevice]) -> None:
-        self._active_device_ids = {device.port for device in devices}
-        self._suppress_selection_updates = True
-        self._device_panel.set_active_devices(devices)
-        self._suppress_selection_updates = False
+        self._hot.active_device_ids = {device.port for device in devices}
+        with QSignalBlocker(self._device_panel):
+            self._device_panel.set_active_devices(devices)
         if devices:
             names = ", ".join(device.name for device in devices)
             self._device_panel.set_status(f"Listening on {names}")
@@ -457,8 +519,8 @@ class MainWindow(QMainWindow):
         self._device_panel.set_status("MIDI input stopped.")
 
     def _complete_learn(self, event: MidiEvent) -> None:
-        node_id = self._pending_learn
-        self._pending_learn = None
+        node_id = self._hot.pending_learn
+        self._hot.pending_learn = None
         if not node_id:
             return
         if event.source is None:
@@ -471,6 +533,7 @@ class MainWindow(QMainWindow):
         node.config["profile_id"] = profile.id
         node.config["device_ports"] = [event.source]
         node.config["control_type"] = profile.control_type
+        self._node_editor.refresh_node_display(node_id)
         self._status_bar.showMessage(f"Learned control: {profile.name}", 6000)
         self._device_panel.set_status(f"Learned control: {profile.name}")
         self._node_inspector.refresh()
@@ -481,16 +544,56 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "MIDI Error", message)
 
     @Slot(object)
-    def _handle_midi_event(self, event: MidiEvent) -> None:
-        if self._pending_learn:
+    def _enqueue_event(self, event: MidiEvent) -> None:
+        # Runs on the emitting thread: only touch the deque and post a wake-up
+        # when no drain is already scheduled.
+        self._midi_queue.append(event)
+        if not self._midi_drain_pending:
+            self._midi_drain_pending = True
+            self._midiQueueReady.emit()
+
+    @Slot()
+    def _schedule_midi_drain(self) -> None:
+        if not self._midi_drain_timer.isActive():
+            self._midi_drain_timer.start()
+
+    @Slot()
+    def _drain_midi_events(self) -> None:
+        self._midi_drain_pending = False
+        last_event: Optional[MidiEvent] = None
+        for _ in range(self.MIDI_DRAIN_BATCH):
+            try:
+                event = self._midi_queue.popleft()
+            except IndexError:
+                break
+            self._dispatch_midi_event(event)
+            last_event = event
+
+        if last_event is not None:
+            self._show_midi_event_status(last_event)
+
+        if self._midi_queue and not self._midi_drain_pending:
+            self._midi_drain_pending = True
+            self._midi_drain_timer.start()
+
+    def _dispatch_midi_event(self, event: MidiEvent) -> None:
+        if self._hot.pending_learn:
             self._complete_learn(event)
 
-        source_device = self._midi_manager.find_device(event.source) if event.source else None
+        if self._action_engine.refresh_if_stale():
+            self._prune_display_state()
+        triggered_inputs = self._action_engine.handle_event(event)
+        if triggered_inputs:
+            self._update_midi_input_visuals(triggered_inputs, event)
+
+    def _show_midi_event_status(self, event: MidiEvent) -> None:
+        by_port = self._device_by_port
+        source_device = by_port.get(event.source) if event.source else None
         source_label = source_device.name if source_device else (event.source or "Unknown device")
         alias_names = [
             alias_device.name
             for alias in event.aliases
-            if (alias_device := self._midi_manager.find_device(alias)) is not None
+            if (alias_device := by_port.get(alias)) is not None
         ]
         if alias_names:
             source_label += f" ({', '.join(alias_names)})"
@@ -500,9 +603,6 @@ class MainWindow(QMainWindow):
         self._status_bar.showMessage(
             f"Event: {event.message_type} value={event.value} note={event.note}", 2000
         )
-        triggered_inputs = self._action_engine.handle_event(event)
-        if triggered_inputs:
-            self._update_midi_input_visuals(triggered_inputs, event)
 
     def _update_midi_input_visuals(self, nodes: Iterable[Node], event: MidiEvent) -> None:
         display_info = self._extract_event_display(event)
@@ -510,28 +610,37 @@ class MainWindow(QMainWindow):
             return
 
         value, active, raw = display_info
+        display_state = self._display_state
         for node in nodes:
+            shadow = display_state.get(node.id)
+            if shadow is None:
+                shadow = display_state[node.id] = _Shadow()
+
             changed = False
-            prev_value = node.config.get("_display_last_value")
-            if prev_value is None or abs(float(prev_value) - value) > 1e-3:
-                node.config["_display_last_value"] = value
+            if shadow.value is None or abs(shadow.value - value) > 1e-3:
+                shadow.value = value
                 changed = True
-
-            prev_active = bool(node.config.get("_display_last_active", False))
-            if prev_active != active:
-                node.config["_display_last_active"] = active
+            if shadow.active != active:
+                shadow.active = active
                 changed = True
-
-            if raw is not None:
-                if node.config.get("_display_last_raw") != raw:
-                    node.config["_display_last_raw"] = raw
-                    changed = True
-            elif "_display_last_raw" in node.config:
-                node.config.pop("_display_last_raw", None)
+            if shadow.raw != raw:
+                shadow.raw = raw
                 changed = True
 
             if changed:
-                self._node_editor.update_node(node)
+                self._node_editor.set_node_indicator(node.id, shadow.value, shadow.active)
+
+    def _prune_display_state(self) -> None:
+        """
+        Drop indicator shadows for nodes that are no longer in the graph.
+        """
+
+        display_state = self._display_state
+        if not display_state:
+            return
+        nodes = self._graph.nodes()
+        for node_id in [node_id for node_id in display_state if node_id not in nodes]:
+            del display_state[node_id]
 
     def _extract_event_display(self, event: MidiEvent) -> Optional[tuple[float, bool, Optional[int]]]:
         message = event.message_type
@@ -578,7 +687,9 @@ class MainWindow(QMainWindow):
         self._workspace_dirty = True
 
     def _reload_graph(self) -> None:
+        self._display_state.clear()
         self._node_editor.reload()
+        # Imports start from fresh action state (e.g. per-control dedup values).
         self._action_engine = ActionEngine(self._graph, profile_store=self._profile_store)
 
     def _load_preset(self, preset: WorkspacePreset) -> None:
@@ -589,7 +700,7 @@ class MainWindow(QMainWindow):
             midi_manager=self._midi_manager,
         )
         self._workspace_path = None
-        self._active_device_ids = {str(port) for port in info.get("active_devices", [])}
+        self._hot.active_device_ids = {str(port) for port in info.get("active_devices", [])}
         self._workspace_dirty = True
         self._reload_graph()
         self._refresh_devices()
@@ -624,7 +735,7 @@ class MainWindow(QMainWindow):
         )
         self._workspace_path = path
         self._last_workspace_dir = path.parent
-        self._active_device_ids = {str(port) for port in info.get("active_devices", [])}
+        self._hot.active_device_ids = {str(port) for port in info.get("active_devices", [])}
         self._workspace_dirty = False
         self._reload_graph()
 
@@ -633,7 +744,7 @@ class MainWindow(QMainWindow):
             self._graph,
             profiles=self._profile_store.serialize(),
             virtual_devices=self._midi_manager.export_virtual_devices(),
-            active_devices=self._active_device_ids,
+            active_devices=self._hot.active_device_ids,
         )
 
     def _save_to_path(
@@ -643,6 +754,7 @@ class MainWindow(QMainWindow):
         update_workspace_path: bool,
         show_message: bool = True,
     ) -> bool:
+        self._node_inspector.flush_pending_edits()
         try:
             payload = self._workspace_payload()
             path.parent.mkdir(parents=True, exist_ok=True)
@@ -669,6 +781,7 @@ class MainWindow(QMainWindow):
         if self._save_to_path(target, update_workspace_path=update_path, show_message=False):
             self._workspace_dirty = False
 
-    def _mark_workspace_dirty(self) -> None:
-        self._workspace_dirty = True
+    def _mark_workspace_dirty(self, *_args) -> None:
+        if not self._workspace_dirty:
+            self._workspace_dirty = True
 
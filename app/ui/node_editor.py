@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+import math
 import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import groupby
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QLineF, QPoint, QPointF, QRectF, QSignalBlocker, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QAction,
+    QBrush,
+    QColor,
+    QGuiApplication,
+    QKeyEvent,
+    QPainter,
+    QPen,
+    QPixmap,
+    QTransform,
+)
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView, QInputDialog, QMenu, QWidget
 
-from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QKeyEvent, QPainter, QPen
-from PySide6.QtWidgets import QGraphicsScene, QGraphicsView, QInputDialog, QMenu, QWidget
+try:
+    from PySide6.QtGui import QOpenGLContext, QSurfaceFormat
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # pragma: no cover - OpenGL support is optional.
+    QOpenGLWidget = None  # type: ignore[assignment,misc]
 
 from app.nodes import (
     Node,
@@ -18,9 +38,10 @@ from app.nodes import (
     get_node_templates,
 )
 
-from .connection_graphics import ConnectionGraphicsItem
+from .connection_graphics import ConnectionGraphicsItem, ConnectionKey, ConnectionsLayerItem, connection_path
 from .group_graphics import GroupGraphicsItem, GroupGeometry
 from .node_graphics import NodeGraphicsItem
+from .spatial_index import GridIndex
 
 
 class NodeEditorScene(QGraphicsScene):
@@ -39,32 +60,70 @@ class NodeEditorScene(QGraphicsScene):
         super().__init__(parent)
         self._graph = graph
         self._node_items: Dict[str, NodeGraphicsItem] = {}
-        self._connection_items: Dict[Tuple[str, str, str, str], ConnectionGraphicsItem] = {}
+        # Every connection is in _connection_keys; only hovered or selected ones
+        # have an item in _connection_items, the rest live in _connection_layer.
+        self._connection_keys: Set[ConnectionKey] = set()
+        self._connection_items: Dict[ConnectionKey, ConnectionGraphicsItem] = {}
+        self._idle_connections: Set[ConnectionKey] = set()
+        self._conn_by_node: DefaultDict[str, Set[ConnectionKey]] = defaultdict(set)
         self._temporary_connection: Optional[ConnectionGraphicsItem] = None
         self._group_items: Dict[str, GroupGraphicsItem] = {}
         self._suppress_group_geometry = False
         self._suppress_group_movement = False
+        self._in_batch = 0
+        self._groups_dirty = False
+        self._collapsed_nodes: Set[str] = set()
+        self._culled_nodes: Set[str] = set()
+        self._cull_rect: Optional[QRectF] = None
+        self._in_view: Set[str] = set()
+        self._cull_exempt: Set[str] = set()  # out of view but kept while selected
+        self._node_index = GridIndex()
+        self._zoom = 1.0
+        self._dirty_connection_nodes: Set[str] = set()
+        self._connection_flush_timer = QTimer(self)
+        self._connection_flush_timer.setSingleShot(True)
+        self._connection_flush_timer.setInterval(0)
+        self._connection_flush_timer.timeout.connect(self._flush_pending_updates)
+        self._moved_nodes: Set[str] = set()
+        self._port_index = GridIndex(cell_size=64.0)
+        self._port_keys: Dict[str, List[Tuple[str, str, str]]] = {}
+
+        # Qt's BSP index still serves painting and item hit-testing; depth 0 lets
+        # Qt size the tree from the item count. Port lookups use _port_index.
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setBspTreeDepth(0)
+        self._port_pos_cache: Dict[str, Dict[Tuple[str, str], QPointF]] = {}
+        self._connection_layer = ConnectionsLayerItem()
+        self.addItem(self._connection_layer)
+        self.selectionChanged.connect(self._queue_unselected_connections_idle)
+
+        # The grid is a single pre-rendered tile that Qt repeats natively.
+        self._grid_tile = self._build_grid_tile()
+        self.setBackgroundBrush(QBrush(self._grid_tile))
 
     @property
     def graph(self) -> NodeGraph:
         return self._graph
 
-    def drawBackground(self, painter, rect):  # type: ignore[override]
-        super().drawBackground(painter, rect)
-
-        start_x = int(rect.left()) - (int(rect.left()) % self.GRID_SIZE)
-        start_y = int(rect.top()) - (int(rect.top()) % self.GRID_SIZE)
+    def _build_grid_tile(self) -> QPixmap:
+        app = QGuiApplication.instance()
+        ratio = app.devicePixelRatio() if app is not None else 1.0
+        size = self.GRID_SIZE
+        tile = QPixmap(int(size * ratio), int(size * ratio))
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.transparent)
 
+        painter = QPainter(tile)
         painter.setPen(self.GRID_PEN)
-
-        for x in range(start_x, int(rect.right()) + self.GRID_SIZE, self.GRID_SIZE):
-            painter.drawLine(x, rect.top(), x, rect.bottom())
-
-        for y in range(start_y, int(rect.bottom()) + self.GRID_SIZE, self.GRID_SIZE):
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        painter.drawLine(QLineF(0.5, 0.0, 0.5, size))
+        painter.drawLine(QLineF(0.0, 0.5, size, 0.5))
+        painter.end()
+        return tile
 
     def add_node_item(self, node: Node, position: Optional[QPointF] = None) -> NodeGraphicsItem:
         item = NodeGraphicsItem(node)
+        item.setFlag(QGraphicsItem.ItemUsesExtendedStyleOptions, True)
+        item.set_zoom(self._zoom)
         self._node_items[node.id] = item
         self.addItem(item)
 
@@ -75,29 +134,43 @@ class NodeEditorScene(QGraphicsScene):
             else:
                 position = QPointF(0.0, 0.0)
 
-        item.setPos(position)
+        item.set_pos_silently(position.x(), position.y())
         self._graph.set_node_position(node.id, position.x(), position.y())
-        item.positionChanged.connect(self._handle_node_position_changed)
+        self._index_node(node.id, item)
         item.portPressed.connect(self.portPressed.emit)
         item.portReleased.connect(self.portReleased.emit)
+        self._recull_nodes((node.id,))
         return item
 
     def remove_node_item(self, node_id: str) -> None:
         item = self._node_items.pop(node_id, None)
         if item is not None:
             self.removeItem(item)
-
-        for key in [
-            key
-            for key in self._connection_items.keys()
-            if node_id in (key[0], key[2])
-        ]:
+        self._node_index.remove(node_id)
+        for key in self._port_keys.pop(node_id, ()):
+            self._port_index.remove(key)
+        self._port_pos_cache.pop(node_id, None)
+        self._culled_nodes.discard(node_id)
+        self._in_view.discard(node_id)
+        self._cull_exempt.discard(node_id)
+        self._collapsed_nodes.discard(node_id)
+
+        for key in list(self._conn_by_node.get(node_id, ())):
             self.remove_connection_item(*key)
 
     def clear_node_items(self) -> None:
         for item in list(self._node_items.values()):
             self.removeItem(item)
         self._node_items.clear()
+        self._node_index.clear()
+        self._port_index.clear()
+        self._port_keys.clear()
+        self._port_pos_cache.clear()
+        self._culled_nodes.clear()
+        self._cull_rect = None
+        self._in_view.clear()
+        self._cull_exempt.clear()
+        self._collapsed_nodes.clear()
 
         for item in list(self._group_items.values()):
             self.removeItem(item)
@@ -106,13 +179,39 @@ class NodeEditorScene(QGraphicsScene):
         for item in list(self._connection_items.values()):
             self.removeItem(item)
         self._connection_items.clear()
+        self._connection_keys.clear()
+        self._idle_connections.clear()
+        self._conn_by_node.clear()
+        self._dirty_connection_nodes.clear()
+        self._moved_nodes.clear()
+        self._connection_layer.clear()
 
         self.clear_temporary_connection()
 
     def refresh_node(self, node: Node) -> None:
         item = self._node_items.get(node.id)
         if item is not None:
+            # Drop cached port positions first: update_node re-routes connections.
+            self._port_pos_cache.pop(node.id, None)
             item.update_node(node)
+            self._index_node(node.id, item)
+
+    def set_zoom(self, zoom: float) -> None:
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        for item in self._node_items.values():
+            item.set_zoom(zoom)
+
+    def refresh_node_display(self, node_id: str) -> None:
+        item = self._node_items.get(node_id)
+        if item is not None:
+            item.invalidate_control_info()
+
+    def refresh_node_indicator(self, node_id: str, value: Optional[float], active: bool) -> None:
+        item = self._node_items.get(node_id)
+        if item is not None:
+            item.set_indicator(value, active)
 
     def selected_node_items(self) -> list[NodeGraphicsItem]:
         return [item for item in self.selectedItems() if isinstance(item, NodeGraphicsItem)]
@@ -132,15 +231,13 @@ class NodeEditorScene(QGraphicsScene):
         source_port: str,
         target_node: str,
         target_port: str,
-    ) -> ConnectionGraphicsItem:
+    ) -> None:
         key = (source_node, source_port, target_node, target_port)
-        item = self._connection_items.get(key)
-        if item is None:
-            item = ConnectionGraphicsItem((source_node, source_port), (target_node, target_port))
-            self._connection_items[key] = item
-            self.addItem(item)
-        self.update_connection_path(item)
-        return item
+        if key not in self._connection_keys:
+            self._connection_keys.add(key)
+            self._conn_by_node[source_node].add(key)
+            self._conn_by_node[target_node].add(key)
+        self.update_connection_path(key)
 
     def remove_connection_item(
         self,
@@ -150,39 +247,188 @@ class NodeEditorScene(QGraphicsScene):
         target_port: str,
     ) -> None:
         key = (source_node, source_port, target_node, target_port)
+        if key not in self._connection_keys:
+            return
+        self._connection_keys.discard(key)
+        self._idle_connections.discard(key)
+        self._connection_layer.remove(key)
         item = self._connection_items.pop(key, None)
         if item is not None:
             self.removeItem(item)
-
-    def update_connection_path(self, item: ConnectionGraphicsItem) -> None:
-        source_node, source_port = item.source
-        target = item.target
+        for node_id in (source_node, target_node):
+            keys = self._conn_by_node.get(node_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._conn_by_node[node_id]
+
+    def update_connection_path(self, key: ConnectionKey) -> None:
+        source_node, source_port, target_node, target_port = key
+        if source_node in self._collapsed_nodes or target_node in self._collapsed_nodes:
+            self._hide_connection(key)
+            return
         start = self.port_scene_position(source_node, "output", source_port)
-        end = (
-            self.port_scene_position(target[0], "input", target[1])
-            if target is not None
-            else None
-        )
         if start is None:
             return
-        item.update_path(start, end or start)
+        end = self.port_scene_position(target_node, "input", target_port)
+        path = connection_path(start, end or start)
+        item = self._connection_items.get(key)
+        if item is not None:
+            item.setPath(path)
+        else:
+            self._connection_layer.set_path(key, path)
 
     def update_connections_for_node(self, node_id: str) -> None:
+        for key in self._conn_by_node.get(node_id, ()):
+            self.update_connection_path(key)
+
+    def connection_at(self, scene_pos: QPointF) -> Optional[ConnectionKey]:
+        """
+        Return the idle connection under ``scene_pos`` unless a node covers it.
+        """
+
+        key = self._connection_layer.key_at(scene_pos)
+        if key is None:
+            return None
+        top = self.itemAt(scene_pos, QTransform())
+        if top is not None and top.topLevelItem().zValue() > self._connection_layer.zValue():
+            return None
+        return key
+
+    def promote_connection(self, key: ConnectionKey) -> Optional[ConnectionGraphicsItem]:
+        """
+        Give an idle connection its own item so it can be hovered and selected.
+        """
+
+        item = self._connection_items.get(key)
+        if item is not None:
+            self._idle_connections.discard(key)
+            return item
+        path = self._connection_layer.path(key)
+        if path is None:
+            return None
+        self._connection_layer.remove(key)
+        item = ConnectionGraphicsItem((key[0], key[1]), (key[2], key[3]))
+        item.setPath(path)
+        self._connection_items[key] = item
+        self.addItem(item)
+        return item
+
+    def select_connections_in(self, rect: QRectF) -> None:
+        """
+        Select the idle connections a rubber band crossed; promoted ones are
+        already selected by Qt's own rubber-band handling.
+        """
+
+        for key in self._connection_layer.keys_in(rect):
+            item = self.promote_connection(key)
+            if item is not None:
+                item.setSelected(True)
+
+    def queue_connection_idle(self, key: ConnectionKey) -> None:
+        """
+        Hand a promoted connection back to the layer on the next event-loop
+        pass, once it is neither hovered nor selected.
+        """
+
+        if key not in self._connection_items:
+            return
+        self._idle_connections.add(key)
+        if not self._connection_flush_timer.isActive():
+            self._connection_flush_timer.start()
+
+    def _queue_unselected_connections_idle(self) -> None:
         for key, item in self._connection_items.items():
-            if node_id in (key[0], key[2]):
-                self.update_connection_path(item)
+            if not item.isSelected() and not item.hovered:
+                self.queue_connection_idle(key)
+
+    def _flush_idle_connections(self) -> None:
+        idle = self._idle_connections
+        self._idle_connections = set()
+        for key in idle:
+            item = self._connection_items.get(key)
+            if item is None or item.isSelected() or item.hovered:
+                continue
+            del self._connection_items[key]
+            self.removeItem(item)
+            self.update_connection_path(key)
+
+    def _hide_connection(self, key: ConnectionKey) -> None:
+        self._connection_layer.remove(key)
+        item = self._connection_items.pop(key, None)
+        if item is not None:
+            self.removeItem(item)
+
+    def mousePressEvent(self, event) -> None:  # type: ignore[override]
+        if event.button() == Qt.LeftButton:
+            key = self.connection_at(event.scenePos())
+            if key is not None:
+                self.promote_connection(key)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
+        if event.buttons() == Qt.NoButton:
+            key = self.connection_at(event.scenePos())
+            # A promotion whose hover never arrived is handed back here.
+            self._queue_unselected_connections_idle()
+            if key is not None:
+                self.promote_connection(key)
+        super().mouseMoveEvent(event)
+
+    def queue_connection_update(self, node_id: str) -> None:
+        """
+        Re-route ``node_id``'s connections on the next event-loop pass; each
+        connection is updated once even when both of its nodes moved.
+        """
+
+        self._dirty_connection_nodes.add(node_id)
+        if not self._connection_flush_timer.isActive():
+            self._connection_flush_timer.start()
+
+    def queue_node_moved(self, node_id: str) -> None:
+        """
+        Record that a node item was moved interactively; the graph, indexes and
+        connections are updated once per event-loop pass with its latest position.
+        """
+
+        self._moved_nodes.add(node_id)
+        if not self._connection_flush_timer.isActive():
+            self._connection_flush_timer.start()
+
+    def _flush_pending_updates(self) -> None:
+        moved = self._moved_nodes
+        self._moved_nodes = set()
+        for node_id in moved:
+            item = self._node_items.get(node_id)
+            if item is None:
+                # Removed since the move was queued.
+                continue
+            pos = item.pos()
+            self._graph.set_node_position(node_id, pos.x(), pos.y())
+            self._index_node(node_id, item)
+            self._dirty_connection_nodes.add(node_id)
+            self._update_groups_for_node(node_id)
+        self._recull_nodes(moved)
+        self._flush_dirty_connections()
+        self._flush_idle_connections()
+
+    def _flush_dirty_connections(self) -> None:
+        dirty = self._dirty_connection_nodes
+        self._dirty_connection_nodes = set()
+        keys: Set[ConnectionKey] = set()
+        for node_id in dirty:
+            keys.update(self._conn_by_node.get(node_id, ()))
+        for key in keys:
+            self.update_connection_path(key)
 
     def sync_connections(self) -> None:
-        graph_keys = {
-            (connection.source_node, connection.source_port, connection.target_node, connection.target_port)
-            for connection in self._graph.connections()
-        }
-        existing_keys = set(self._connection_items.keys())
+        graph_keys = self._graph.connection_keys()
+        existing_keys = self._connection_keys
 
-        for key in existing_keys - graph_keys:
+        for key in list(existing_keys - graph_keys):
             self.remove_connection_item(*key)
 
-        for key in graph_keys - existing_keys:
+        for key in list(graph_keys - existing_keys):
             self.add_connection_item(*key)
 
     def start_temporary_connection(self, source_node: str, source_port: str) -> None:
@@ -217,24 +463,96 @@ class NodeEditorScene(QGraphicsScene):
             self._temporary_connection = None
 
     def port_scene_position(self, node_id: str, direction: str, port_name: str) -> Optional[QPointF]:
+        cached = self._port_pos_cache.get(node_id)
+        if cached is not None:
+            position = cached.get((direction, port_name))
+            if position is not None:
+                return position
         node_item = self._node_items.get(node_id)
         if node_item is None:
             return None
-        return node_item.scene_port_position(direction, port_name)
-
-    def port_at(self, scene_pos: QPointF, direction: str) -> Optional[Tuple[str, str]]:
-        for node_id, node_item in reversed(list(self._node_items.items())):
-            port_name = node_item.port_at_scene_position(scene_pos, direction)
-            if port_name:
-                return node_id, port_name
+        position = node_item.scene_port_position(direction, port_name)
+        if position is not None:
+            if cached is None:
+                cached = self._port_pos_cache[node_id] = {}
+            cached[(direction, port_name)] = position
+        return position
+
+    def port_at(
+        self, scene_pos: QPointF, direction: str, threshold: float = 12.0
+    ) -> Optional[Tuple[str, str]]:
+        probe = QRectF(scene_pos.x() - threshold, scene_pos.y() - threshold, threshold * 2, threshold * 2)
+        px, py = scene_pos.x(), scene_pos.y()
+        threshold_sq = threshold * threshold
+        # Nearest in-range port per node.
+        nearest: Dict[str, Tuple[float, str]] = {}
+        for node_id, port_direction, port_name in self._port_index.intersection(probe):
+            if port_direction != direction:
+                continue
+            position = self.port_scene_position(node_id, direction, port_name)
+            if position is None:
+                continue
+            dx = position.x() - px
+            dy = position.y() - py
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > threshold_sq:
+                continue
+            current = nearest.get(node_id)
+            if current is None or distance_sq < current[0]:
+                nearest[node_id] = (distance_sq, port_name)
+        if not nearest:
+            return None
+        if len(nearest) == 1:
+            node_id, (_distance, port_name) = next(iter(nearest.items()))
+            return node_id, port_name
+        # Overlapping nodes: the most recently added one is on top and wins.
+        for node_id in reversed(self._node_items):
+            hit = nearest.get(node_id)
+            if hit is not None:
+                return node_id, hit[1]
         return None
 
-    def _handle_node_position_changed(self, node_id: str, x: float, y: float) -> None:
-        self._graph.set_node_position(node_id, x, y)
-        self.update_connections_for_node(node_id)
-        self._update_groups_for_node(node_id)
+    def _index_node(self, node_id: str, item: NodeGraphicsItem) -> None:
+        """
+        Refresh the spatial indexes (node bounds and port centres) after a node
+        moved or changed shape.
+        """
+
+        self._port_pos_cache.pop(node_id, None)
+        self._node_index.insert(node_id, item.sceneBoundingRect())
+        for key in self._port_keys.pop(node_id, ()):
+            self._port_index.remove(key)
+        keys: List[Tuple[str, str, str]] = []
+        for direction, ports in (("input", item.node.inputs), ("output", item.node.outputs)):
+            for port in ports:
+                position = self.port_scene_position(node_id, direction, port.name)
+                if position is None:
+                    continue
+                key = (node_id, direction, port.name)
+                self._port_index.insert(key, QRectF(position, position))
+                keys.append(key)
+        self._port_keys[node_id] = keys
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer ``sync_groups`` until the outermost batch exits, running it at
+        most once however many edits were made inside.
+        """
+
+        self._in_batch += 1
+        try:
+            yield
+        finally:
+            self._in_batch -= 1
+            if self._in_batch == 0 and self._groups_dirty:
+                self.sync_groups()
 
     def sync_groups(self) -> None:
+        if self._in_batch:
+            self._groups_dirty = True
+            return
+        self._groups_dirty = False
         graph_groups = {group.id: group for group in self._graph.groups()}
         current_ids = set(self._group_items.keys())
 
@@ -247,6 +565,7 @@ class NodeEditorScene(QGraphicsScene):
             item = self._group_items.get(group_id)
             if item is None:
                 item = GroupGraphicsItem(group_id, group.title, collapsed=group.collapsed)
+                item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
                 item.geometryChanged.connect(self._handle_group_geometry_changed)
                 item.collapseToggled.connect(self._handle_group_collapse_toggled)
                 item.positionChanged.connect(self._handle_group_position_changed)
@@ -275,21 +594,24 @@ class NodeEditorScene(QGraphicsScene):
                 item.setPos(QPointF(*group.position))
                 self._suppress_group_movement = False
 
-        self._apply_group_visibility()
+        self._apply_group_visibility(graph_groups.values())
 
     def bounding_rect_for_nodes(self, node_ids: Iterable[str]) -> Optional[QRectF]:
-        bounding: Optional[QRectF] = None
+        left = top = math.inf
+        right = bottom = -math.inf
+        node_items = self._node_items
         for node_id in node_ids:
-            item = self._node_items.get(node_id)
+            item = node_items.get(node_id)
             if item is None:
                 continue
             rect = item.sceneBoundingRect()
-            if bounding is None:
-                bounding = QRectF(rect)
-            else:
-                bounding = bounding.united(rect)
-        if bounding is None:
+            left = min(left, rect.left())
+            top = min(top, rect.top())
+            right = max(right, rect.right())
+            bottom = max(bottom, rect.bottom())
+        if left == math.inf:
             return None
+        bounding = QRectF(left, top, right - left, bottom - top)
         header_offset = 40.0
         horiz_padding = 24.0
         top_padding = header_offset
@@ -328,18 +650,100 @@ class NodeEditorScene(QGraphicsScene):
     def _calculate_group_rect(self, group: NodeGroup) -> Optional[QRectF]:
         return self.bounding_rect_for_nodes(group.node_ids)
 
-    def _apply_group_visibility(self) -> None:
+    def _apply_group_visibility(self, groups: Optional[Iterable[NodeGroup]] = None) -> None:
+        if groups is None:
+            groups = self._graph.groups()
         collapsed_nodes = {
-            node_id for group in self._graph.groups() if group.collapsed for node_id in group.node_ids
+            node_id for group in groups if group.collapsed for node_id in group.node_ids
         }
-        for node_id, item in self._node_items.items():
-            visible = node_id not in collapsed_nodes
+        # Only nodes whose collapsed state changed (and their connections)
+        # need their visibility touched.
+        changed = collapsed_nodes ^ self._collapsed_nodes
+        self._collapsed_nodes = collapsed_nodes
+        if not changed:
+            return
+        culled_nodes = self._culled_nodes
+        touched: Set[ConnectionKey] = set()
+        for node_id in changed:
+            touched.update(self._conn_by_node.get(node_id, ()))
+            item = self._node_items.get(node_id)
+            if item is None:
+                continue
+            collapsed = node_id in collapsed_nodes
+            visible = not collapsed and node_id not in culled_nodes
             if item.isVisible() != visible:
                 item.setVisible(visible)
-            if not visible:
+            if collapsed:
                 item.setSelected(False)
-        for key, item in self._connection_items.items():
-            visible = key[0] not in collapsed_nodes and key[2] not in collapsed_nodes
+        for key in touched:
+            # Hidden while either end is collapsed; re-routed otherwise.
+            self.update_connection_path(key)
+
+    def cull_to_rect(self, rect: QRectF) -> None:
+        """
+        Hide node items that fall outside ``rect`` (the visible scene area).
+        Only nodes entering or leaving the view since the last call are
+        touched, so panning scales with the view edge rather than the graph.
+        Selected nodes are never culled.
+        """
+
+        first_pass = self._cull_rect is None
+        self._cull_rect = QRectF(rect)
+        in_view = self._node_index.intersection(rect)
+        # The first pass after a rebuild has no previous view to diff against.
+        previous = set(self._node_items) if first_pass else self._in_view
+        self._in_view = in_view
+        newly_out = previous - in_view
+        newly_out.update(self._cull_exempt)
+        self._cull_exempt = set()
+        for node_id in in_view - previous:
+            if node_id in self._culled_nodes:
+                self._culled_nodes.discard(node_id)
+                self._set_node_shown(node_id)
+        for node_id in newly_out:
+            if node_id in in_view or node_id in self._culled_nodes:
+                continue
+            item = self._node_items.get(node_id)
+            if item is None:
+                continue
+            if item.isSelected():
+                self._cull_exempt.add(node_id)
+                continue
+            self._culled_nodes.add(node_id)
+            self._set_node_shown(node_id)
+
+    def _recull_nodes(self, node_ids: Iterable[str]) -> None:
+        """
+        Re-test moved nodes against the last culling rect, so nodes brought
+        into view by a programmatic move are shown without waiting for a scroll.
+        """
+
+        rect = self._cull_rect
+        if rect is None:
+            return
+        for node_id in node_ids:
+            item = self._node_items.get(node_id)
+            if item is None:
+                continue
+            self._cull_exempt.discard(node_id)
+            if rect.intersects(item.sceneBoundingRect()):
+                self._in_view.add(node_id)
+                self._culled_nodes.discard(node_id)
+            else:
+                self._in_view.discard(node_id)
+                if item.isSelected():
+                    self._cull_exempt.add(node_id)
+                    self._culled_nodes.discard(node_id)
+                else:
+                    self._culled_nodes.add(node_id)
+            self._set_node_shown(node_id)
+
+    def _set_node_shown(self, node_id: str) -> None:
+        item = self._node_items.get(node_id)
+        if item is None:
+            return
+        visible = node_id not in self._culled_nodes and node_id not in self._collapsed_nodes
+        if item.isVisible() != visible:
             item.setVisible(visible)
 
     def _handle_group_geometry_changed(self, group_id: str, geometry: GroupGeometry) -> None:
@@ -371,18 +775,25 @@ class NodeEditorScene(QGraphicsScene):
         if group is None:
             return
 
-        self._suppress_group_geometry = True
-        try:
-            for node_id in group.node_ids:
-                node_item = self._node_items.get(node_id)
-                if node_item is None:
-                    continue
-                new_pos = node_item.pos() + delta
-                node_item.setPos(new_pos)
-                self._graph.set_node_position(node_id, new_pos.x(), new_pos.y())
-                self.update_connections_for_node(node_id)
-        finally:
-            self._suppress_group_geometry = False
+        dx, dy = delta.x(), delta.y()
+        moved: Dict[str, Tuple[float, float]] = {}
+        for node_id in group.node_ids:
+            node_item = self._node_items.get(node_id)
+            if node_item is None:
+                continue
+            pos = node_item.pos()
+            x, y = pos.x() + dx, pos.y() + dy
+            node_item.set_pos_silently(x, y)
+            moved[node_id] = (x, y)
+
+        self._graph.set_node_positions(moved)
+        touched: Set[ConnectionKey] = set()
+        for node_id in moved:
+            self._index_node(node_id, self._node_items[node_id])
+            touched.update(self._conn_by_node.get(node_id, ()))
+        self._recull_nodes(moved)
+        for key in touched:
+            self.update_connection_path(key)
 
         group.position = (group.position[0] + delta.x(), group.position[1] + delta.y())
         self._graph.set_group_rect(group_id, group.position[0], group.position[1], group.size[0], group.size[1])
@@ -397,6 +808,10 @@ class PendingConnection:
 class NodeEditorView(QGraphicsView):
     """
     Graphics view wrapper around the node editor scene.
+
+    ``selectionChanged``, ``connectionCreated`` and ``connectionDeleted`` are
+    emitted synchronously from input handlers; consumers doing more than
+    trivial work should connect with ``Qt.QueuedConnection``.
     """
 
     selectionChanged = Signal(object)  # list[Node]
@@ -409,31 +824,85 @@ class NodeEditorView(QGraphicsView):
         self._templates: tuple[NodeTemplate, ...] = tuple(
             sorted(get_node_templates(), key=lambda template: (template.category, template.title))
         )
+        self._template_actions = self._build_template_actions()
         self._scene = NodeEditorScene(self._graph, self)
         self.setScene(self._scene)
         self.setRenderHint(QPainter.Antialiasing)
         self.setRenderHint(QPainter.TextAntialiasing)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setRubberBandSelectionMode(Qt.IntersectsItemShape)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        if self._setup_viewport():
+            # QOpenGLWidget repaints its whole framebuffer; partial updates
+            # would leave stale or cleared regions.
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Item paint() implementations save/restore around their own transforms.
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
 
         self._scene.portPressed.connect(self._on_port_pressed)
         self._scene.portReleased.connect(self._on_port_released)
         self._scene.selectionChanged.connect(self._emit_selection_changed)
+        self.rubberBandChanged.connect(self._on_rubber_band_changed)
 
         self._pending_connection: Optional[PendingConnection] = None
         self._space_bar_down = False
         self._panning = False
         self._pan_button = Qt.NoButton
         self._last_pan_point = QPoint()
+        self._rubber_band_rect: Optional[QRectF] = None
+
+        # Temporary-connection updates are coalesced to roughly one per frame.
+        self._pending_move_pos: Optional[QPointF] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
 
         self._populate_from_graph()
         self._scene.sync_connections()
         self._scene.sync_groups()
         self._center_on_graph()
 
+    def _build_template_actions(self) -> tuple[tuple[str, tuple[QAction, ...]], ...]:
+        # Templates are static, so the context-menu entries are built once and
+        # re-added to each menu instead of being recreated per right-click.
+        sections = []
+        for category, templates in groupby(self._templates, key=lambda template: template.category):
+            actions = []
+            for template in templates:
+                action = QAction(template.title, self)
+                action.setData(template.type)
+                action.setToolTip(template.description)
+                action.setStatusTip(template.description)
+                actions.append(action)
+            sections.append((category, tuple(actions)))
+        return tuple(sections)
+
+    def _setup_viewport(self) -> bool:
+        """
+        Install an OpenGL viewport when a context can actually be created;
+        returns ``False`` to keep the raster viewport.
+        """
+
+        if QOpenGLWidget is None:
+            return False
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(4)
+        probe = QOpenGLContext()
+        probe.setFormat(surface_format)
+        if not probe.create():
+            return False
+        viewport = QOpenGLWidget()
+        viewport.setFormat(surface_format)
+        self.setViewport(viewport)
+        return True
+
     @property
     def templates(self) -> Iterable[NodeTemplate]:
         return self._templates
@@ -487,15 +956,9 @@ class NodeEditorView(QGraphicsView):
         if selected_node_items or selected_group_items:
             menu.addSeparator()
 
-        last_category = None
-        for template in self._templates:
-            if template.category != last_category:
-                menu.addSection(template.category)
-                last_category = template.category
-            action = menu.addAction(template.title)
-            action.setData(template.type)
-            action.setToolTip(template.description)
-            action.setStatusTip(template.description)
+        for category, actions in self._template_actions:
+            menu.addSection(category)
+            menu.addActions(actions)
 
         menu.addSeparator()
         reset_action = menu.addAction("Reset View")
@@ -523,6 +986,7 @@ class NodeEditorView(QGraphicsView):
         if chosen == reset_action:
             self.resetTransform()
             self.centerOn(0, 0)
+            self._zoom_changed()
             return
 
         node_type = chosen.data()
@@ -558,9 +1022,38 @@ class NodeEditorView(QGraphicsView):
         if event.modifiers() & Qt.ControlModifier:
             zoom_factor = 1.2 if event.angleDelta().y() > 0 else 1 / 1.2
             self.scale(zoom_factor, zoom_factor)
+            self._zoom_changed()
         else:
             super().wheelEvent(event)
 
+    def scrollContentsBy(self, dx: int, dy: int) -> None:  # type: ignore[override]
+        super().scrollContentsBy(dx, dy)
+        self._update_culling()
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_culling()
+
+    def _zoom_changed(self) -> None:
+        # Items pick their level of detail from the zoom pushed here.
+        self._scene.set_zoom(self.transform().m11())
+        self._update_culling()
+
+    def _on_rubber_band_changed(self, viewport_rect, from_scene: QPointF, to_scene: QPointF) -> None:
+        if not viewport_rect.isNull():
+            self._rubber_band_rect = QRectF(from_scene, to_scene).normalized()
+            return
+        # The band was released: idle connections are not items, so Qt's
+        # rubber-band selection cannot see them; select the ones it crossed.
+        rect = self._rubber_band_rect
+        self._rubber_band_rect = None
+        if rect is not None:
+            self._scene.select_connections_in(rect)
+
+    def _update_culling(self) -> None:
+        visible_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        self._scene.cull_to_rect(visible_rect)
+
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.MiddleButton or (event.button() == Qt.LeftButton and self._space_bar_down):
             self._panning = True
@@ -582,9 +1075,17 @@ class NodeEditorView(QGraphicsView):
             event.accept()
             return
         if self._pending_connection is not None:
-            self._scene.update_temporary_connection(self.mapToScene(event.pos()))
+            self._pending_move_pos = self.mapToScene(event.pos())
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         super().mouseMoveEvent(event)
 
+    def _flush_move(self) -> None:
+        scene_pos = self._pending_move_pos
+        self._pending_move_pos = None
+        if scene_pos is not None and self._pending_connection is not None:
+            self._scene.update_temporary_connection(scene_pos)
+
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if self._panning and event.button() == self._pan_button:
             self._panning = False
@@ -613,39 +1114,54 @@ class NodeEditorView(QGraphicsView):
         self._delete_selected_items()
 
     def reload(self) -> None:
-        self._scene.clear_node_items()
-        self._populate_from_graph()
-        self._scene.sync_connections()
-        self._scene.sync_groups()
+        # Rebuild without per-item index maintenance or scene signals; the BSP
+        # tree is rebuilt once and a single selectionChanged is emitted below.
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        with QSignalBlocker(self._scene), self._scene.batch():
+            self._scene.clear_node_items()
+            self._populate_from_graph()
+            self._scene.sync_connections()
+            self._scene.sync_groups()
+        self._scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.updateSceneRect(self._scene.sceneRect())
+        self.viewport().update()
         self._center_on_graph()
+        self._update_culling()
         self._emit_selection_changed()
 
     def update_node(self, node: Node) -> None:
         self._scene.refresh_node(node)
         self._scene.sync_groups()
 
+    def refresh_node_display(self, node_id: str) -> None:
+        self._scene.refresh_node_display(node_id)
+
+    def set_node_indicator(self, node_id: str, value: Optional[float], active: bool) -> None:
+        self._scene.refresh_node_indicator(node_id, value, active)
+
     def _populate_from_graph(self) -> None:
         for node in self._graph.nodes().values():
             self._scene.add_node_item(node)
 
     def _delete_selected_items(self) -> None:
-        for connection_item in list(self._scene.selected_connection_items()):
-            source_node, source_port = connection_item.source
-            target_node, target_port = connection_item.target or ("", "")
-            if target_node:
-                self._graph.disconnect(source_node, source_port, target_node, target_port)
-                self._scene.remove_connection_item(source_node, source_port, target_node, target_port)
-                self._emit_connection_deleted(
-                    NodeConnection(source_node, source_port, target_node, target_port)
-                )
-
-        for item in list(self._scene.selected_node_items()):
-            node_id = item.node.id
-            self._graph.remove_node(node_id)
-            self._scene.remove_node_item(node_id)
-
-        self._scene.sync_connections()
-        self._scene.sync_groups()
+        with self._scene.batch():
+            for connection_item in list(self._scene.selected_connection_items()):
+                source_node, source_port = connection_item.source
+                target_node, target_port = connection_item.target or ("", "")
+                if target_node:
+                    self._graph.disconnect(source_node, source_port, target_node, target_port)
+                    self._scene.remove_connection_item(source_node, source_port, target_node, target_port)
+                    self._emit_connection_deleted(
+                        NodeConnection(source_node, source_port, target_node, target_port)
+                    )
+
+            for item in list(self._scene.selected_node_items()):
+                node_id = item.node.id
+                self._graph.remove_node(node_id)
+                self._scene.remove_node_item(node_id)
+
+            self._scene.sync_connections()
+            self._scene.sync_groups()
 
     def _center_on_graph(self) -> None:
         items = self._scene.items()
@@ -682,6 +1198,8 @@ class NodeEditorView(QGraphicsView):
 
     def _cancel_pending_connection(self) -> None:
         self._pending_connection = None
+        self._pending_move_pos = None
+        self._move_timer.stop()
         self._scene.clear_temporary_connection()
 
     def _emit_connection_created(self, connection: NodeConnection) -> None:
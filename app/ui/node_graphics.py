@@ -1,61 +1,96 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QPointF, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtCore import QPointF, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QFontMetricsF, QPainter, QPainterPath, QPen, QPixmap
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
 
 from app.nodes import Node, NodePortDirection
 
+# (direction, port name, local centre, label rect, elided label, label baseline origin)
+PortLayoutEntry = Tuple[str, str, QPointF, QRectF, str, QPointF]
 
-class PortHandleItem(QGraphicsObject):
-    """
-    Invisible interactive hotspot for a node port.
+
+class NodePortsLayerItem(QGraphicsItem):
     """
+    Invisible interactive hotspots for all ports of one node.
 
-    pressed = Signal(str, str)  # direction, port name
-    released = Signal(str, str)
-    hovered = Signal(str, str, bool)
+    Presses and hover are resolved against the parent's cached port layout,
+    so each node needs one hotspot item regardless of its port count.
+    """
 
-    def __init__(self, direction: str, port_name: str, radius: float, parent=None):
-        super().__init__(parent)
-        self._direction = direction
-        self._port_name = port_name
-        self._radius = radius
+    def __init__(self, node_item: "NodeGraphicsItem") -> None:
+        super().__init__(node_item)
+        self._node_item = node_item
+        self._shape = QPainterPath()
+        self._pressed: Optional[Tuple[str, str]] = None
         self.setAcceptedMouseButtons(Qt.LeftButton)
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CrossCursor)
 
+    def rebuild(self) -> None:
+        radius = self._node_item.PORT_RADIUS + 3
+        path = QPainterPath()
+        for _direction, _name, position, _label_rect, _label, _origin in self._node_item.port_layout():
+            path.addEllipse(position, radius, radius)
+        self.prepareGeometryChange()
+        self._shape = path
+
     def boundingRect(self) -> QRectF:  # type: ignore[override]
-        size = self._radius * 2 + 6
-        return QRectF(-size / 2, -size / 2, size, size)
+        return self._shape.boundingRect()
+
+    def shape(self) -> QPainterPath:  # type: ignore[override]
+        return self._shape
 
     def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
-        # Hotspot does not render visible content.
+        # Hotspots do not render visible content.
         _ = painter, option, widget
 
+    def port_at(self, pos: QPointF) -> Optional[Tuple[str, str]]:
+        radius = self._node_item.PORT_RADIUS + 3
+        best: Optional[Tuple[str, str]] = None
+        best_sq = radius * radius
+        px, py = pos.x(), pos.y()
+        for direction, name, position, _label_rect, _label, _origin in self._node_item.port_layout():
+            dx = position.x() - px
+            dy = position.y() - py
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= best_sq:
+                best = (direction, name)
+                best_sq = distance_sq
+        return best
+
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
-        if event.button() == Qt.LeftButton:
-            self.pressed.emit(self._direction, self._port_name)
-            event.accept()
-        else:
-            super().mousePressEvent(event)
+        port = self.port_at(event.pos()) if event.button() == Qt.LeftButton else None
+        if port is None:
+            event.ignore()
+            return
+        self._pressed = port
+        self._node_item._emit_port_pressed(*port)
+        event.accept()
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
-        if event.button() == Qt.LeftButton:
-            self.released.emit(self._direction, self._port_name)
+        port = self._pressed
+        self._pressed = None
+        if event.button() == Qt.LeftButton and port is not None:
+            self._node_item._emit_port_released(*port)
             event.accept()
         else:
             super().mouseReleaseEvent(event)
 
     def hoverEnterEvent(self, event) -> None:  # type: ignore[override]
-        self.hovered.emit(self._direction, self._port_name, True)
+        self._node_item._set_hover_port(self.port_at(event.pos()))
         super().hoverEnterEvent(event)
 
+    def hoverMoveEvent(self, event) -> None:  # type: ignore[override]
+        self._node_item._set_hover_port(self.port_at(event.pos()))
+        super().hoverMoveEvent(event)
+
     def hoverLeaveEvent(self, event) -> None:  # type: ignore[override]
-        self.hovered.emit(self._direction, self._port_name, False)
+        self._node_item._set_hover_port(None)
         super().hoverLeaveEvent(event)
 
 
@@ -66,8 +101,35 @@ BADGE_STYLES: dict[str, tuple[str, QColor]] = {
     "fader": ("FDR", QColor("#5aa9e6")),
 }
 CUSTOM_BADGE_COLOR = QColor("#9aa5b1")
+_CONTROL_TYPE_MAP: dict[str, str] = {
+    "key": "key",
+    "button": "key",
+    "note": "key",
+    "note_on": "key",
+    "note_off": "key",
+    "pad": "pad",
+    "drum_pad": "pad",
+    "pad_button": "pad",
+    "fader": "fader",
+    "slider": "fader",
+    "knob": "knob",
+    "dial": "knob",
+    "continuous": "knob",
+    "control_change": "knob",
+}
 DEFAULT_INDICATOR_COLOR = QColor("#7aa2f7")
 INDICATOR_TRACK_COLOR = QColor("#1f2230")
+BADGE_TEXT_PEN = QPen(QColor("#111318"))
+
+# Knob pointer directions across the 270 degree sweep, indexed by value * _KNOB_STEPS.
+_KNOB_STEPS = 256
+_KNOB_COS = tuple(math.cos(math.radians(-135 + 270 * i / _KNOB_STEPS)) for i in range(_KNOB_STEPS + 1))
+_KNOB_SIN = tuple(math.sin(math.radians(-135 + 270 * i / _KNOB_STEPS)) for i in range(_KNOB_STEPS + 1))
+
+
+@lru_cache(maxsize=32)
+def _accent_pen(rgba: int) -> QPen:
+    return QPen(QColor.fromRgba(rgba), 2.4)
 
 
 class NodeGraphicsItem(QGraphicsObject):
@@ -75,7 +137,6 @@ class NodeGraphicsItem(QGraphicsObject):
     Visual representation of a node in the graphics scene.
     """
 
-    positionChanged = Signal(str, float, float)
     portPressed = Signal(str, str, str)  # node_id, direction, port_name
     portReleased = Signal(str, str, str)
 
@@ -91,38 +152,155 @@ class NodeGraphicsItem(QGraphicsObject):
     TEXT_COLOR = QColor("#f0f3ff")
     PORT_COLOR = QColor("#86c1b9")
     PORT_HOVER_COLOR = QColor("#c0f0e5")
+    PORT_HINT_COLOR = QColor(134, 193, 185, 110)
     PORT_RADIUS = 6
+    TRACK_PEN = QPen(QColor("#000000"), 0.8)
+    # View zoom thresholds: below PORT_LOD ports collapse into a hint bar per
+    # side, below CARD_LOD the node is drawn as a flat card.
+    PORT_LOD = 0.5
+    CARD_LOD = 0.2
+    # Item cache resolution relative to item size; stays sharp up to this zoom.
+    CACHE_SCALE = 2.0
+
+    # Fonts need a running QGuiApplication, so they are built on first use.
+    _TITLE_FONT: Optional[QFont] = None
+    _PORT_FONT: Optional[QFont] = None
+    _BADGE_FONT: Optional[QFont] = None
+    _BADGE_METRICS: Optional[QFontMetrics] = None
+    _PORT_METRICS: Optional[QFontMetricsF] = None
 
     def __init__(self, node: Node, parent: Optional[QGraphicsItem] = None) -> None:
         super().__init__(parent)
+        self._ensure_fonts()
         self._node = node
         self._input_port_positions: Dict[str, QPointF] = {}
         self._output_port_positions: Dict[str, QPointF] = {}
-        self._input_handles: Dict[str, PortHandleItem] = {}
-        self._output_handles: Dict[str, PortHandleItem] = {}
         self._hover_port: Optional[Tuple[str, str]] = None  # direction, name
+        self._indicator_value: Optional[float] = None
+        self._indicator_active = False
+        self._control_info: Optional[tuple[Optional[str], Optional[str], Optional[QColor]]] = None
+        # Body, header, border, title and badge, rendered once per state change.
+        self._chrome: Optional[QPixmap] = None
+        self._indicator_rect: Optional[QRectF] = None
+        self._indicator_type: Optional[str] = None
+        self._indicator_accent = DEFAULT_INDICATOR_COLOR
+        self._body_height = 0.0
+        self._bounding_rect = QRectF()
+        self._port_layout: List[PortLayoutEntry] = []
+        self._port_dot_rects: Dict[Tuple[str, str], QRectF] = {}
+        self._port_hint_rects: List[QRectF] = []
+        self._zoom = 1.0
+        self._notify_position = True
+        self._update_geometry()
 
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
-        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._apply_cache_mode()
         self.setZValue(5)
         self.setToolTip(node.config.get("_description", node.title))
 
-        self._create_port_handles()
+        self._ports_layer = NodePortsLayerItem(self)
+        self._rebuild_port_layout()
+
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        if cls._TITLE_FONT is not None:
+            return
+        title_font = QFont()
+        title_font.setPointSizeF(10.5)
+        title_font.setBold(True)
+        badge_font = QFont()
+        badge_font.setPointSizeF(8.5)
+        badge_font.setBold(True)
+        cls._TITLE_FONT = title_font
+        cls._PORT_FONT = QFont("Sans Serif", 9)
+        cls._PORT_METRICS = QFontMetricsF(cls._PORT_FONT)
+        cls._BADGE_FONT = badge_font
+        cls._BADGE_METRICS = QFontMetrics(badge_font)
 
     @property
     def node(self) -> Node:
         return self._node
 
     def boundingRect(self) -> QRectF:  # type: ignore[override]
+        return self._bounding_rect
+
+    def _update_geometry(self) -> None:
+        # Callers must have called prepareGeometryChange() when the item is in a scene.
         port_rows = max(len(self._node.inputs), len(self._node.outputs))
-        body_height = max(1, port_rows) * self.PORT_HEIGHT
-        height = self.HEADER_HEIGHT + body_height + self.PADDING * 2
-        return QRectF(0, 0, self.WIDTH, height)
+        self._body_height = max(1, port_rows) * self.PORT_HEIGHT
+        height = self.HEADER_HEIGHT + self._body_height + self.PADDING * 2
+        self._bounding_rect = QRectF(0, 0, self.WIDTH, height)
+
+    def _apply_cache_mode(self) -> None:
+        # Item-coordinate caching survives pans and zooms; the pixmap is only
+        # re-rendered when the item itself calls update().
+        rect = self._bounding_rect
+        size = QSize(int(rect.width() * self.CACHE_SCALE), int(rect.height() * self.CACHE_SCALE))
+        self.setCacheMode(QGraphicsItem.ItemCoordinateCache, size)
 
     def paint(self, painter: QPainter, option, widget=None) -> None:  # type: ignore[override, unused-argument]
-        rect = self.boundingRect()
+        rect = self._bounding_rect
+        exposed = option.exposedRect
+        if self._zoom < self.CARD_LOD:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.SELECTED_BORDER_PEN.color() if self.isSelected() else self.BODY_BRUSH)
+            painter.drawRect(rect)
+            return
+        if self._chrome is None:
+            self._chrome = self._render_chrome()
+        painter.drawPixmap(rect.topLeft(), self._chrome)
+
+        ports_exposed = exposed.bottom() >= rect.top() + self.HEADER_HEIGHT
+        if self._zoom < self.PORT_LOD:
+            if ports_exposed:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self.PORT_HINT_COLOR)
+                for hint_rect in self._port_hint_rects:
+                    painter.drawRoundedRect(hint_rect, 3, 3)
+            return
+
+        if self._indicator_rect is not None and exposed.intersects(self._indicator_rect):
+            self._draw_value_indicator(painter)
+
+        # Ports
+        if ports_exposed:
+            painter.setFont(self._PORT_FONT)
+            self._draw_ports(painter, exposed)
+
+    def set_zoom(self, zoom: float) -> None:
+        """
+        Track the view scale; nodes are item-cached at a fixed resolution, so
+        the detail level is switched here rather than read from the painter.
+        """
+
+        level = self._detail_level(self._zoom)
+        self._zoom = zoom
+        if self._detail_level(zoom) != level:
+            self.update()
+
+    def _detail_level(self, zoom: float) -> int:
+        if zoom < self.CARD_LOD:
+            return 0
+        if zoom < self.PORT_LOD:
+            return 1
+        return 2
+
+    def _invalidate_chrome(self) -> None:
+        self._chrome = None
+        self.update()
+
+    def _render_chrome(self) -> QPixmap:
+        rect = self._bounding_rect
+        ratio = self.CACHE_SCALE
+        pixmap = QPixmap(math.ceil(rect.width() * ratio), math.ceil(rect.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        # Fills are drawn aliased; the antialiased border stroke covers their edges.
 
         # Body
         painter.setPen(Qt.NoPen)
@@ -143,25 +321,30 @@ class NodeGraphicsItem(QGraphicsObject):
         )
 
         # Border
+        painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setBrush(Qt.NoBrush)
         painter.setPen(self.SELECTED_BORDER_PEN if self.isSelected() else self.BORDER_PEN)
         painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
 
+        self._draw_header_content(painter, header_rect)
+        painter.end()
+        return pixmap
+
+    def _draw_header_content(self, painter: QPainter, header_rect: QRectF) -> None:
         # Title
         painter.setPen(self.TEXT_COLOR)
-        font = QFont()
-        font.setPointSizeF(10.5)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._TITLE_FONT)
         canonical_type, badge_label, badge_color = self._control_display_info()
 
         available_right = header_rect.right() - self.PADDING
 
-        indicator_rect = self._draw_value_indicator(
-            painter, header_rect, available_right, canonical_type, badge_color
-        )
-        if indicator_rect is not None:
-            available_right = indicator_rect.left() - self.PADDING
+        # The indicator itself is drawn live in paint(); reserve its space here.
+        self._indicator_rect = None
+        self._indicator_type = canonical_type
+        self._indicator_accent = badge_color or DEFAULT_INDICATOR_COLOR
+        if self._indicator_value is not None:
+            self._indicator_rect = self._indicator_geometry(header_rect, available_right, canonical_type)
+            available_right = self._indicator_rect.left() - self.PADDING
 
         if badge_label:
             badge_rect = self._draw_badge(
@@ -182,70 +365,92 @@ class NodeGraphicsItem(QGraphicsObject):
         )
         painter.drawText(title_rect, Qt.AlignVCenter | Qt.AlignLeft, self._node.title)
 
-        # Ports
-        painter.setFont(QFont("Sans Serif", 9))
-        self._draw_ports(painter, rect)
-
-    def _draw_ports(self, painter: QPainter, rect: QRectF) -> None:
-        self._input_port_positions.clear()
-        self._output_port_positions.clear()
-
+    def _draw_ports(self, painter: QPainter, exposed: QRectF) -> None:
         hovered = self._hover_port
+        painter.setPen(self.TEXT_COLOR)
+        top, bottom = exposed.top(), exposed.bottom()
+        for direction, name, position, label_rect, label, origin in self._port_layout:
+            # Each port row spans its label rect vertically.
+            if label_rect.bottom() < top or label_rect.top() > bottom:
+                continue
+            painter.setBrush(
+                self.PORT_HOVER_COLOR
+                if hovered is not None and hovered[0] == direction and hovered[1] == name
+                else self.PORT_COLOR
+            )
+            painter.drawEllipse(position, self.PORT_RADIUS, self.PORT_RADIUS)
+            painter.drawText(origin, label)
 
-        port_rows = max(len(self._node.inputs), len(self._node.outputs))
-        body_height = max(1, port_rows) * self.PORT_HEIGHT
-        body_top = rect.top() + self.HEADER_HEIGHT
+    def _rebuild_port_layout(self) -> None:
+        """
+        Recompute port centres and label rects; only needed when the port list
+        or node geometry changes.
+        """
+
+        rect = self._bounding_rect
         body_rect = QRectF(
             rect.left() + self.PADDING,
-            body_top + self.PADDING,
+            rect.top() + self.HEADER_HEIGHT + self.PADDING,
             rect.width() - self.PADDING * 2,
-            body_height,
+            self._body_height,
         )
-
-        painter.setPen(self.TEXT_COLOR)
+        label_width = body_rect.width() / 2
+        metrics = self._PORT_METRICS
+        # Vertical offset from a row's centre line to the text baseline.
+        baseline = (metrics.ascent() - metrics.descent()) / 2
+        layout: List[PortLayoutEntry] = []
+        self._input_port_positions.clear()
+        self._output_port_positions.clear()
+        self._port_dot_rects.clear()
 
         for index, port in enumerate(self._node.inputs):
             y = body_rect.top() + index * self.PORT_HEIGHT + self.PORT_HEIGHT / 2
             position = QPointF(body_rect.left(), y)
-            painter.setBrush(
-                self.PORT_HOVER_COLOR
-                if hovered == ("input", port.name)
-                else self.PORT_COLOR
+            label_rect = QRectF(
+                position.x() + self.PORT_RADIUS * 2 + 4,
+                y - self.PORT_HEIGHT / 2,
+                label_width,
+                self.PORT_HEIGHT,
             )
-            painter.drawEllipse(position, self.PORT_RADIUS, self.PORT_RADIUS)
+            label = metrics.elidedText(port.name, Qt.ElideRight, label_width)
+            origin = QPointF(label_rect.left(), y + baseline)
             self._input_port_positions[port.name] = position
-            painter.drawText(
-                QRectF(
-                    position.x() + self.PORT_RADIUS * 2 + 4,
-                    y - self.PORT_HEIGHT / 2,
-                    body_rect.width() / 2,
-                    self.PORT_HEIGHT,
-                ),
-                Qt.AlignVCenter | Qt.AlignLeft,
-                port.name,
-            )
+            layout.append(("input", port.name, position, label_rect, label, origin))
 
         for index, port in enumerate(self._node.outputs):
             y = body_rect.top() + index * self.PORT_HEIGHT + self.PORT_HEIGHT / 2
             position = QPointF(body_rect.right(), y)
-            painter.setBrush(
-                self.PORT_HOVER_COLOR
-                if hovered == ("output", port.name)
-                else self.PORT_COLOR
+            label_rect = QRectF(
+                position.x() - self.PORT_RADIUS * 2 - label_width - 4,
+                y - self.PORT_HEIGHT / 2,
+                label_width,
+                self.PORT_HEIGHT,
             )
-            painter.drawEllipse(position, self.PORT_RADIUS, self.PORT_RADIUS)
+            label = metrics.elidedText(port.name, Qt.ElideRight, label_width)
+            origin = QPointF(label_rect.right() - metrics.horizontalAdvance(label), y + baseline)
             self._output_port_positions[port.name] = position
-            painter.drawText(
+            layout.append(("output", port.name, position, label_rect, label, origin))
+
+        self._port_layout = layout
+        extent = self.PORT_RADIUS + 2
+        for direction, name, position, _label_rect, _label, _origin in layout:
+            self._port_dot_rects[(direction, name)] = QRectF(
+                position.x() - extent, position.y() - extent, extent * 2, extent * 2
+            )
+        self._port_hint_rects = []
+        for positions in (self._input_port_positions, self._output_port_positions):
+            if not positions:
+                continue
+            ys = [position.y() for position in positions.values()]
+            x = next(iter(positions.values())).x()
+            self._port_hint_rects.append(
                 QRectF(
-                    position.x() - self.PORT_RADIUS * 2 - (body_rect.width() / 2) - 4,
-                    y - self.PORT_HEIGHT / 2,
-                    body_rect.width() / 2,
-                    self.PORT_HEIGHT,
-                ),
-                Qt.AlignVCenter | Qt.AlignRight,
-                port.name,
+                    x - self.PORT_RADIUS / 2,
+                    min(ys) - self.PORT_RADIUS,
+                    self.PORT_RADIUS,
+                    max(ys) - min(ys) + self.PORT_RADIUS * 2,
+                )
             )
-
         self.update_port_handle_positions()
 
     def input_port_position(self, name: str) -> Optional[QPointF]:
@@ -257,15 +462,47 @@ class NodeGraphicsItem(QGraphicsObject):
     def update_node(self, node: Node) -> None:
         self.prepareGeometryChange()
         self._node = node
-        self._recreate_port_handles()
+        self._control_info = None
+        self._update_geometry()
+        self._apply_cache_mode()
+        self._hover_port = None
+        self._rebuild_port_layout()
         self.setToolTip(node.config.get("_description", node.title))
-        self.update()
+        self._invalidate_chrome()
+
+    def set_indicator(self, value: Optional[float], active: bool) -> None:
+        shown = self._indicator_value is not None
+        self._indicator_value = value
+        self._indicator_active = active
+        if shown != (value is not None):
+            # Showing or hiding the indicator shifts the badge and title.
+            self._invalidate_chrome()
+        elif self._indicator_rect is not None:
+            self.update(self._indicator_rect.adjusted(-1, -1, 1, 1))
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):  # type: ignore[override]
         if change == QGraphicsItem.ItemPositionHasChanged:
-            self.positionChanged.emit(self._node.id, value.x(), value.y())
+            if self._notify_position:
+                # The scene coalesces moves and applies them once per event-loop pass.
+                scene = self.scene()
+                if scene is not None and hasattr(scene, "queue_node_moved"):
+                    scene.queue_node_moved(self._node.id)
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
+            self._invalidate_chrome()
         return super().itemChange(change, value)
 
+    def set_pos_silently(self, x: float, y: float) -> None:
+        """
+        Move the item without queueing a scene move notification; for callers
+        that update the graph and indexes themselves.
+        """
+
+        self._notify_position = False
+        try:
+            self.setPos(x, y)
+        finally:
+            self._notify_position = True
+
     def scene_port_position(self, direction: str, port_name: str) -> Optional[QPointF]:
         if direction == "input":
             position = self._input_port_positions.get(port_name)
@@ -275,67 +512,53 @@ class NodeGraphicsItem(QGraphicsObject):
             return None
         return self.mapToScene(position)
 
-    def _create_port_handles(self) -> None:
-        radius = self.PORT_RADIUS
-        for port in self._node.inputs:
-            handle = PortHandleItem("input", port.name, radius, self)
-            handle.pressed.connect(self._emit_port_pressed)
-            handle.released.connect(self._emit_port_released)
-            handle.hovered.connect(self._set_hover_port)
-            self._input_handles[port.name] = handle
-        for port in self._node.outputs:
-            handle = PortHandleItem("output", port.name, radius, self)
-            handle.pressed.connect(self._emit_port_pressed)
-            handle.released.connect(self._emit_port_released)
-            handle.hovered.connect(self._set_hover_port)
-            self._output_handles[port.name] = handle
-
-    def _recreate_port_handles(self) -> None:
-        for handle in list(self._input_handles.values()) + list(self._output_handles.values()):
-            handle.setParentItem(None)
-        self._input_handles.clear()
-        self._output_handles.clear()
-        self._create_port_handles()
-
     def _emit_port_pressed(self, direction: str, port_name: str) -> None:
         self.portPressed.emit(self._node.id, direction, port_name)
 
     def _emit_port_released(self, direction: str, port_name: str) -> None:
         self.portReleased.emit(self._node.id, direction, port_name)
 
-    def _set_hover_port(self, direction: str, port_name: str, hovered: bool) -> None:
-        self._hover_port = (direction, port_name) if hovered else None
-        self.update()
+    def port_layout(self) -> List[PortLayoutEntry]:
+        return self._port_layout
+
+    def _set_hover_port(self, current: Optional[Tuple[str, str]]) -> None:
+        previous = self._hover_port
+        if current == previous:
+            return
+        self._hover_port = current
+        # Only the port dots change colour; repaint just those.
+        dirty = QRectF()
+        for key in (previous, current):
+            if key is not None:
+                rect = self._port_dot_rects.get(key)
+                if rect is not None:
+                    dirty = dirty.united(rect)
+        if dirty.isNull():
+            self.update()
+        else:
+            self.update(dirty)
 
     def update_port_handle_positions(self) -> None:
-        for name, position in self._input_port_positions.items():
-            handle = self._input_handles.get(name)
-            if handle:
-                handle.setPos(position)
-        for name, position in self._output_port_positions.items():
-            handle = self._output_handles.get(name)
-            if handle:
-                handle.setPos(position)
+        self._ports_layer.rebuild()
         scene = self.scene()
-        if scene is not None and hasattr(scene, "update_connections_for_node"):
-            scene.update_connections_for_node(self._node.id)
+        if scene is not None and hasattr(scene, "queue_connection_update"):
+            scene.queue_connection_update(self._node.id)
 
-    def port_at_scene_position(self, scene_pos: QPointF, direction: str, threshold: float = 12.0) -> Optional[str]:
-        if direction == "input":
-            ports = self._input_port_positions.items()
-        else:
-            ports = self._output_port_positions.items()
+    def invalidate_control_info(self) -> None:
+        """
+        Drop the cached badge/indicator style after the node's display config
+        changed in place.
+        """
 
-        threshold_sq = threshold * threshold
-        for name, local_pos in ports:
-            world_pos = self.mapToScene(local_pos)
-            dx = world_pos.x() - scene_pos.x()
-            dy = world_pos.y() - scene_pos.y()
-            if dx * dx + dy * dy <= threshold_sq:
-                return name
-        return None
+        self._control_info = None
+        self._invalidate_chrome()
 
     def _control_display_info(self) -> tuple[Optional[str], Optional[str], Optional[QColor]]:
+        if self._control_info is None:
+            self._control_info = self._resolve_control_display_info()
+        return self._control_info
+
+    def _resolve_control_display_info(self) -> tuple[Optional[str], Optional[str], Optional[QColor]]:
         if self._node.type != "midi.input":
             return None, None, None
 
@@ -363,18 +586,7 @@ class NodeGraphicsItem(QGraphicsObject):
 
     @staticmethod
     def _canonical_control_type(control_type: str) -> Optional[str]:
-        value = control_type.lower()
-        if not value:
-            return None
-        if value in {"key", "button", "note", "note_on", "note_off"}:
-            return "key"
-        if value in {"pad", "drum_pad", "pad_button"}:
-            return "pad"
-        if value in {"fader", "slider"}:
-            return "fader"
-        if value in {"knob", "dial", "continuous", "control_change"}:
-            return "knob"
-        return None
+        return _CONTROL_TYPE_MAP.get(control_type.lower())
 
     def _draw_badge(
         self,
@@ -389,16 +601,12 @@ class NodeGraphicsItem(QGraphicsObject):
             return None
 
         painter.save()
-        badge_font = QFont()
-        badge_font.setPointSizeF(8.5)
-        badge_font.setBold(True)
-        painter.setFont(badge_font)
-        metrics = painter.fontMetrics()
-        text_width = metrics.horizontalAdvance(label)
+        painter.setFont(self._BADGE_FONT)
+        text_width = _badge_text_width(label)
         padding_x = 8
         padding_y = 4
         badge_width = text_width + padding_x * 2
-        badge_height = metrics.height() + padding_y * 2
+        badge_height = self._BADGE_METRICS.height() + padding_y * 2
         max_width = header_rect.width() / 2
         if badge_width > max_width:
             badge_width = max_width
@@ -412,113 +620,87 @@ class NodeGraphicsItem(QGraphicsObject):
         painter.setPen(Qt.NoPen)
         painter.setBrush(color)
         painter.drawRoundedRect(badge_rect, badge_height / 2, badge_height / 2)
-        painter.setPen(QColor("#111318"))
+        painter.setPen(BADGE_TEXT_PEN)
         painter.drawText(badge_rect, Qt.AlignCenter, label)
         painter.restore()
         return badge_rect
 
-    def _draw_value_indicator(
-        self,
-        painter: QPainter,
-        header_rect: QRectF,
-        right_edge: float,
-        canonical_type: Optional[str],
-        accent_color: Optional[QColor],
-    ) -> Optional[QRectF]:
-        raw_value = self._node.config.get("_display_last_value")
-        if raw_value is None:
-            return None
-
-        try:
-            value = float(raw_value)
-        except (TypeError, ValueError):
-            return None
-
-        value = max(0.0, min(1.0, value))
-        active = bool(self._node.config.get("_display_last_active", value > 0.001))
-        accent = accent_color or DEFAULT_INDICATOR_COLOR
-
-        painter.save()
-
+    def _indicator_geometry(
+        self, header_rect: QRectF, right_edge: float, canonical_type: Optional[str]
+    ) -> QRectF:
         if canonical_type == "fader":
-            width = 12.0
+            width = min(12.0, max(8.0, header_rect.width() * 0.1))
             height = self.HEADER_HEIGHT - 12.0
-            width = min(width, max(8.0, header_rect.width() * 0.1))
-            rect = QRectF(
-                right_edge - width,
-                header_rect.top() + (self.HEADER_HEIGHT - height) / 2,
-                width,
-                height,
-            )
-            painter.setPen(QPen(QColor("#000000"), 0.8))
-            painter.setBrush(INDICATOR_TRACK_COLOR)
-            painter.drawRoundedRect(rect, width / 2, width / 2)
-
-            fill_height = rect.height() * value
-            fill_rect = QRectF(rect.left(), rect.bottom() - fill_height, rect.width(), fill_height)
-            painter.setBrush(accent)
-            painter.setPen(Qt.NoPen)
-            if fill_height > 1.0:
-                inner_rect = fill_rect.adjusted(1, 1, -1, -1)
-                if inner_rect.height() <= 0:
-                    inner_rect = fill_rect
-                painter.drawRoundedRect(inner_rect, width / 2.2, width / 2.2)
-            else:
-                painter.drawRect(fill_rect)
-            painter.restore()
-            return rect
-
-        if canonical_type == "knob":
-            size = min(self.HEADER_HEIGHT - 8.0, 22.0)
-            rect = QRectF(
-                right_edge - size,
-                header_rect.top() + (self.HEADER_HEIGHT - size) / 2,
-                size,
-                size,
-            )
-            center = rect.center()
-            radius = size / 2 - 2
-
-            painter.setPen(QPen(QColor("#000000"), 0.8))
-            painter.setBrush(INDICATOR_TRACK_COLOR)
-            painter.drawEllipse(rect)
-
-            angle = -135 + value * 270
-            radians = math.radians(angle)
-            end_point = QPointF(
-                center.x() + radius * math.cos(radians),
-                center.y() - radius * math.sin(radians),
-            )
-            painter.setPen(QPen(accent, 2.4))
-            painter.drawLine(center, end_point)
-            painter.restore()
-            return rect
-
-        if canonical_type in {"key", "pad"}:
+        elif canonical_type == "knob":
+            width = height = min(self.HEADER_HEIGHT - 8.0, 22.0)
+        elif canonical_type in {"key", "pad"}:
             width = 18.0
             height = self.HEADER_HEIGHT - 14.0
-            rect = QRectF(
-                right_edge - width,
-                header_rect.top() + (self.HEADER_HEIGHT - height) / 2,
-                width,
-                height,
-            )
-            painter.setPen(QPen(QColor("#000000"), 0.8))
-            painter.setBrush(accent if active else INDICATOR_TRACK_COLOR)
-            painter.drawRoundedRect(rect, 4, 4)
-            painter.restore()
-            return rect
-
-        # fallback simple meter
-        width = 18.0
-        height = 6.0
-        rect = QRectF(
+        else:
+            width = 18.0
+            height = 6.0
+        return QRectF(
             right_edge - width,
             header_rect.top() + (self.HEADER_HEIGHT - height) / 2,
             width,
             height,
         )
-        painter.setPen(QPen(QColor("#000000"), 0.8))
+
+    def _draw_value_indicator(self, painter: QPainter) -> None:
+        rect = self._indicator_rect
+        if self._indicator_value is None or rect is None:
+            return
+
+        value = max(0.0, min(1.0, self._indicator_value))
+        draw = self._INDICATOR_PAINTERS.get(self._indicator_type, NodeGraphicsItem._draw_meter_indicator)
+
+        painter.save()
+        draw(self, painter, rect, value, self._indicator_accent)
+        painter.restore()
+
+    def _draw_fader_indicator(self, painter: QPainter, rect: QRectF, value: float, accent: QColor) -> None:
+        width = rect.width()
+        painter.setPen(self.TRACK_PEN)
+        painter.setBrush(INDICATOR_TRACK_COLOR)
+        painter.drawRoundedRect(rect, width / 2, width / 2)
+
+        fill_height = rect.height() * value
+        fill_rect = QRectF(rect.left(), rect.bottom() - fill_height, rect.width(), fill_height)
+        painter.setBrush(accent)
+        painter.setPen(Qt.NoPen)
+        if fill_height > 1.0:
+            inner_rect = fill_rect.adjusted(1, 1, -1, -1)
+            if inner_rect.height() <= 0:
+                inner_rect = fill_rect
+            painter.drawRoundedRect(inner_rect, width / 2.2, width / 2.2)
+        else:
+            painter.drawRect(fill_rect)
+
+    def _draw_knob_indicator(self, painter: QPainter, rect: QRectF, value: float, accent: QColor) -> None:
+        center = rect.center()
+        radius = rect.width() / 2 - 2
+
+        painter.setPen(self.TRACK_PEN)
+        painter.setBrush(INDICATOR_TRACK_COLOR)
+        painter.drawEllipse(rect)
+
+        step = int(value * _KNOB_STEPS)
+        end_point = QPointF(
+            center.x() + radius * _KNOB_COS[step],
+            center.y() - radius * _KNOB_SIN[step],
+        )
+        painter.setPen(_accent_pen(accent.rgba()))
+        painter.drawLine(center, end_point)
+
+    def _draw_key_indicator(self, painter: QPainter, rect: QRectF, value: float, accent: QColor) -> None:
+        painter.setPen(self.TRACK_PEN)
+        painter.setBrush(accent if self._indicator_active else INDICATOR_TRACK_COLOR)
+        painter.drawRoundedRect(rect, 4, 4)
+
+    def _draw_meter_indicator(self, painter: QPainter, rect: QRectF, value: float, accent: QColor) -> None:
+        # fallback simple meter
+        height = rect.height()
+        painter.setPen(self.TRACK_PEN)
         painter.setBrush(INDICATOR_TRACK_COLOR)
         painter.drawRoundedRect(rect, height / 2, height / 2)
 
@@ -528,6 +710,14 @@ class NodeGraphicsItem(QGraphicsObject):
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(fill_rect, height / 2, height / 2)
 
-        painter.restore()
-        return rect
+    _INDICATOR_PAINTERS = {
+        "fader": _draw_fader_indicator,
+        "knob": _draw_knob_indicator,
+        "key": _draw_key_indicator,
+        "pad": _draw_key_indicator,
+    }
+
 
+@lru_cache(maxsize=256)
+def _badge_text_width(label: str) -> int:
+    return NodeGraphicsItem._BADGE_METRICS.horizontalAdvance(label)
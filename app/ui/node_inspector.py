@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+import shlex
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, Signal
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QMargins,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
+    QCompleter,
     QDoubleSpinBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QFileDialog,
     QPlainTextEdit,
     QPushButton,
@@ -20,6 +42,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
     QSpinBox,
+    QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
@@ -28,10 +51,246 @@ from app.midi import ControlProfileStore, MidiDeviceManager
 from app.nodes import Node
 from app.system import list_audio_targets
 
+EditorFactory = Tuple[Callable[[], QWidget], Callable[[Node], None]]
+ChoiceItem = Tuple[str, object]
+
+AUDIO_TARGETS_TTL = 5.0  # seconds before a cached target listing is refreshed
+
+_CONTROL_TYPE_ITEMS: Tuple[ChoiceItem, ...] = (
+    ("Auto (from learned control)", "auto"),
+    ("Key / Button", "key"),
+    ("Pad", "pad"),
+    ("Fader / Slider", "fader"),
+    ("Knob / Dial", "knob"),
+    ("Custom label…", "custom"),
+)
+_MAPPER_CURVES: Tuple[str, ...] = ("linear", "log", "exp", "step")
+_MAPPER_CURVE_ROWS: Dict[str, int] = {curve: row for row, curve in enumerate(_MAPPER_CURVES)}
+
+
+@dataclass(frozen=True)
+class _AudioTargetListing:
+    items: List[ChoiceItem]
+    rows_by_id: Dict[str, int]  # last row per target id, matching the original scan
+    default_row: int
+    listed_at: float
+
+
+class ChoiceListModel(QAbstractListModel):
+    """
+    Flat ``(label, data)`` list model for combo boxes that are repopulated in bulk.
+
+    Replacing the rows is a single model reset, instead of one QStandardItem
+    allocation and row-insert notification per ``QComboBox.addItem`` call.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._items: List[ChoiceItem] = []
+        self._rows: Dict[object, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        label, value = self._items[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return label
+        if role == Qt.UserRole:
+            return value
+        return None
+
+    def set_items(self, items: Iterable[ChoiceItem]) -> None:
+        self.beginResetModel()
+        self._items = list(items)
+        self._rows = {}
+        for row, (_label, value) in enumerate(self._items):
+            self._rows.setdefault(value, row)
+        self.endResetModel()
+
+    def row_for(self, value: object, default: int = 0) -> int:
+        """
+        Dictionary-backed replacement for ``QComboBox.findData`` on this model.
+        """
+
+        return self._rows.get(value, default)
+
+
+class _AudioTargetsSignals(QObject):
+    finished = Signal(object)  # list[AudioTarget]
+
+
+class _AudioTargetsTask(QRunnable):
+    """
+    Lists audio targets on a pool thread; wpctl/pactl calls can take tens of ms.
+    """
+
+    def __init__(self, signals: _AudioTargetsSignals) -> None:
+        super().__init__()
+        self._signals = signals
+
+    def run(self) -> None:
+        self._signals.finished.emit(list_audio_targets())
+
+
+_SHARED_MODELS: Dict[str, ChoiceListModel] = {}
+
+
+def _shared_choice_model(key: str, items: Iterable[ChoiceItem]) -> ChoiceListModel:
+    """
+    Return a process-wide model for a fixed item list, built on first use.
+    """
+
+    model = _SHARED_MODELS.get(key)
+    if model is None:
+        model = _SHARED_MODELS[key] = ChoiceListModel()
+        model.set_items(items)
+    return model
+
+
+_ZERO_MARGINS = QMargins(0, 0, 0, 0)
+
+
+def _tight_vbox() -> QVBoxLayout:
+    layout = QVBoxLayout()
+    layout.setContentsMargins(_ZERO_MARGINS)
+    return layout
+
+
+def _editor_form() -> QFormLayout:
+    """
+    Form layout with its alignment and wrap policy fixed up front, so the
+    style's defaults for these are never consulted.
+    """
+
+    form = QFormLayout()
+    form.setFormAlignment(Qt.AlignLeft | Qt.AlignTop)
+    form.setRowWrapPolicy(QFormLayout.DontWrapRows)
+    return form
+
+
+@contextmanager
+def _signals_blocked(*objects: QObject) -> Iterator[None]:
+    blockers = [QSignalBlocker(obj) for obj in objects]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+def _choice_combo() -> Tuple[QComboBox, ChoiceListModel]:
+    combo = QComboBox()
+    model = ChoiceListModel(combo)
+    combo.setModel(model)
+    view = QListView(combo)
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(50)
+    combo.setView(view)
+    return combo, model
+
+
+class MapperEditorWidget(QWidget):
+    """
+    Range/curve editor for ``logic.mapper`` nodes, built once and rebound per node.
+    """
+
+    nodeConfigChanged = Signal(str, str, object)  # node_id, key, value
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._current_node: Optional[Node] = None
+
+        form = _editor_form()
+        self.setLayout(form)
+
+        self._in_min_spin = QSpinBox()
+        self._in_min_spin.setRange(0, 127)
+        self._in_max_spin = QSpinBox()
+        self._in_max_spin.setRange(0, 127)
+        self._out_min_spin = QDoubleSpinBox()
+        self._out_min_spin.setRange(0.0, 1.0)
+        self._out_min_spin.setSingleStep(0.01)
+        self._out_max_spin = QDoubleSpinBox()
+        self._out_max_spin.setRange(0.0, 1.0)
+        self._out_max_spin.setSingleStep(0.01)
+
+        self._curve_combo = QComboBox()
+        self._curve_combo.setModel(
+            _shared_choice_model("mapper_curves", ((curve, curve) for curve in _MAPPER_CURVES))
+        )
+
+        self._steps_spin = QSpinBox()
+        self._steps_spin.setRange(2, 128)
+
+        form.addRow("Input min", self._in_min_spin)
+        form.addRow("Input max", self._in_max_spin)
+        form.addRow("Output min", self._out_min_spin)
+        form.addRow("Output max", self._out_max_spin)
+        form.addRow("Curve", self._curve_combo)
+        form.addRow("Steps", self._steps_spin)
+
+        self._in_min_spin.valueChanged.connect(self._on_input_min_changed)
+        self._in_max_spin.valueChanged.connect(self._on_input_max_changed)
+        self._out_min_spin.valueChanged.connect(self._on_output_min_changed)
+        self._out_max_spin.valueChanged.connect(self._on_output_max_changed)
+        self._curve_combo.currentIndexChanged.connect(self._on_curve_changed)
+        self._steps_spin.valueChanged.connect(self._on_steps_changed)
+
+    def bind(self, node: Node) -> None:
+        self._current_node = node
+        curve = str(node.config.get("curve", "linear"))
+        with _signals_blocked(
+            self._in_min_spin,
+            self._in_max_spin,
+            self._out_min_spin,
+            self._out_max_spin,
+            self._curve_combo,
+            self._steps_spin,
+        ):
+            self._in_min_spin.setValue(int(node.config.get("input_min", 0)))
+            self._in_max_spin.setValue(int(node.config.get("input_max", 127)))
+            self._out_min_spin.setValue(float(node.config.get("output_min", 0.0)))
+            self._out_max_spin.setValue(float(node.config.get("output_max", 1.0)))
+            self._curve_combo.setCurrentIndex(_MAPPER_CURVE_ROWS.get(curve, 0))
+            self._steps_spin.setValue(max(2, int(node.config.get("steps", 8))))
+        self._steps_spin.setEnabled(curve == "step")
+
+    def _emit(self, key: str, value) -> None:
+        if self._current_node is not None:
+            self.nodeConfigChanged.emit(self._current_node.id, key, value)
+
+    def _on_input_min_changed(self, value: int) -> None:
+        self._emit("input_min", int(value))
+
+    def _on_input_max_changed(self, value: int) -> None:
+        self._emit("input_max", int(value))
+
+    def _on_output_min_changed(self, value: float) -> None:
+        self._emit("output_min", float(value))
+
+    def _on_output_max_changed(self, value: float) -> None:
+        self._emit("output_max", float(value))
+
+    def _on_curve_changed(self, index: int) -> None:
+        value = self._curve_combo.itemText(index)
+        self._steps_spin.setEnabled(value == "step")
+        self._emit("curve", value)
+
+    def _on_steps_changed(self, value: int) -> None:
+        self._emit("steps", int(value))
+
 
 class NodeInspector(QGroupBox):
     """
     Simple inspector panel that exposes configuration for the selected node.
+
+    Editors are built once per node type and kept as pages of a QStackedWidget;
+    selecting another node only switches page and rebinds the widgets to the
+    new node's config.
     """
 
     learnRequested = Signal(str)
@@ -49,7 +308,14 @@ class NodeInspector(QGroupBox):
         self._profile_store = profile_store
         self._midi_manager = midi_manager
         self._current_nodes: List[Node] = []
-        self._is_updating = False
+
+        # configChanged is coalesced: spin-box scrolls and multi-field edits
+        # notify once per node per interval instead of once per step.
+        self._pending_config_ids: Dict[str, None] = {}
+        self._config_changed_timer = QTimer(self)
+        self._config_changed_timer.setSingleShot(True)
+        self._config_changed_timer.setInterval(50)
+        self._config_changed_timer.timeout.connect(self._flush_config_changed)
 
         self._control_type_combo: Optional[QComboBox] = None
         self._control_type_custom_edit: Optional[QLineEdit] = None
@@ -61,8 +327,7 @@ class NodeInspector(QGroupBox):
         self._scroll_area.setFrameShape(QFrame.NoFrame)
 
         self._content_widget = QWidget(self._scroll_area)
-        self._content_layout = QVBoxLayout()
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
+        self._content_layout = _tight_vbox()
         self._content_widget.setLayout(self._content_layout)
         self._scroll_area.setWidget(self._content_widget)
 
@@ -71,119 +336,206 @@ class NodeInspector(QGroupBox):
         root_layout.addWidget(self._scroll_area)
         self.setLayout(root_layout)
 
+        self._header_label = QLabel()
+        self._header_label.setWordWrap(True)
+        self._header_label.setStyleSheet("font-weight: bold;")
+        self._description_label = QLabel()
+        self._description_label.setWordWrap(True)
+        self._description_label.setStyleSheet("color: palette(mid);")
+        self._message_label = QLabel()
+        self._content_layout.addWidget(self._header_label)
+        self._content_layout.addWidget(self._description_label)
+        self._editor_stack = QStackedWidget()
+        self._editor_stack.hide()
+        self._content_layout.addWidget(self._message_label)
+        self._content_layout.addWidget(self._editor_stack)
+        self._content_layout.addStretch()
+
+        self._mapper_widget = MapperEditorWidget(self)
+        self._mapper_widget.nodeConfigChanged.connect(self._handle_mapper_config_changed)
+
+        self._editor_factories: Dict[str, EditorFactory] = {
+            "midi.input": (self._create_midi_input_editor, self._bind_midi_input_editor),
+            "logic.mapper": (lambda: self._mapper_widget, self._mapper_widget.bind),
+            "action.volume": (self._create_volume_editor, self._bind_volume_editor),
+            "action.command": (self._create_command_editor, self._bind_command_editor),
+            "action.script": (self._create_script_editor, self._bind_script_editor),
+            "action.shortcut": (self._create_shortcut_editor, self._bind_shortcut_editor),
+            "action.sound": (self._create_sound_editor, self._bind_sound_editor),
+        }
+        self._editor_cache: Dict[str, QWidget] = {}
+        self._active_editor: Optional[QWidget] = None
+
         self._learn_button: Optional[QPushButton] = None
-        self._profile_combo: Optional[QComboBox] = None
-        self._device_combo: Optional[QComboBox] = None
+        # One trigger-profile combo shared by every editor page.
+        self._profile_combo, self._profile_model = _choice_combo()
+        self._profile_combo.currentIndexChanged.connect(self._handle_profile_changed)
+        self._profile_items: Optional[List[ChoiceItem]] = None
+        self._profile_items_revision: Optional[int] = None
+        self._trigger_filter_slots: Dict[str, QWidget] = {}
+        self._device_edit: Optional[QLineEdit] = None
+        self._device_names: Optional[QStringListModel] = None
+        self._device_filter: Optional[QSortFilterProxyModel] = None
+        self._device_ports_by_label: Dict[str, str] = {}
+        self._device_labels_by_port: Dict[str, str] = {}
         self._profile_label: Optional[QLabel] = None
         self._volume_target_combo: Optional[QComboBox] = None
-        self._volume_targets = []
+        self._volume_target_model: Optional[ChoiceListModel] = None
+        self._volume_targets_cache: Optional[_AudioTargetListing] = None
+        self._volume_targets_pending = False
+        self._audio_targets_signals = _AudioTargetsSignals(self)
+        self._audio_targets_signals.finished.connect(self._on_volume_targets_listed)
         self._volume_refresh_button: Optional[QPushButton] = None
+        self._volume_inputs: Optional[tuple[QSpinBox, QSpinBox]] = None
+        self._volume_outputs: Optional[tuple[QDoubleSpinBox, QDoubleSpinBox]] = None
         self._command_command_edit: Optional[QLineEdit] = None
         self._command_args_edit: Optional[QLineEdit] = None
         self._command_cwd_edit: Optional[QLineEdit] = None
         self._command_shell_checkbox: Optional[QCheckBox] = None
         self._script_edit: Optional[QPlainTextEdit] = None
-        self._mapper_inputs: Optional[tuple[QSpinBox, QSpinBox]] = None
-        self._mapper_outputs: Optional[tuple[QDoubleSpinBox, QDoubleSpinBox]] = None
-        self._mapper_curve_combo: Optional[QComboBox] = None
-        self._mapper_steps_spin: Optional[QSpinBox] = None
+        self._script_layout: Optional[QVBoxLayout] = None
+        self._script_summary_label: Optional[QLabel] = None
+        self._script_open_button: Optional[QPushButton] = None
+        self._script_node: Optional[Node] = None
+        self._script_commit_timer = QTimer(self)
+        self._script_commit_timer.setSingleShot(True)
+        self._script_commit_timer.setInterval(250)
+        self._script_commit_timer.timeout.connect(self._commit_script_edit)
+        self._shortcut_edit: Optional[QLineEdit] = None
+        self._sound_path_edit: Optional[QLineEdit] = None
+        self._sound_volume_spin: Optional[QDoubleSpinBox] = None
+        self._sound_trigger_spin: Optional[QSpinBox] = None
+        self._sound_min_spin: Optional[QSpinBox] = None
+        self._sound_note_off_checkbox: Optional[QCheckBox] = None
 
         self.refresh()
 
     def set_nodes(self, nodes: List[Node]) -> None:
+        previous = self._current_nodes
         self._current_nodes = nodes
+        if len(previous) > 1 and len(nodes) > 1:
+            # Still a multi-selection: the placeholder message is already showing.
+            return
+        if len(previous) == len(nodes) and all(old is new for old, new in zip(previous, nodes)):
+            return
         self.refresh()
 
     def set_profile_store(self, store: ControlProfileStore) -> None:
         self._profile_store = store
+        self._invalidate_profile_cache()
         self.refresh()
 
     def set_midi_manager(self, manager: MidiDeviceManager) -> None:
         self._midi_manager = manager
         self.refresh()
 
-    def refresh(self) -> None:
-        self._clear_content()
+    def flush_pending_edits(self) -> None:
+        """
+        Write any debounced script text to its node and emit queued
+        configChanged notifications now, e.g. before the workspace is saved.
+        """
 
-        if not self._current_nodes:
-            self._content_layout.addWidget(QLabel("Select a node to edit its properties."))
-            return
+        self._flush_script_edit()
+        if self._config_changed_timer.isActive():
+            self._config_changed_timer.stop()
+        self._flush_config_changed()
 
-        if len(self._current_nodes) > 1:
-            self._content_layout.addWidget(QLabel("Multiple nodes selected."))
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if watched is self._script_edit and event.type() == QEvent.FocusOut:
+            self._flush_script_edit()
+        return super().eventFilter(watched, event)
+
+    def refresh(self) -> None:
+        if len(self._current_nodes) != 1:
+            self._header_label.hide()
+            self._description_label.hide()
+            self._show_editor(None)
+            if self._current_nodes:
+                self._show_message("Multiple nodes selected.")
+            else:
+                self._show_message("Select a node to edit its properties.")
             return
 
         node = self._current_nodes[0]
-        header = QLabel(f"{node.title} ({node.type})")
-        header.setWordWrap(True)
-        header.setStyleSheet("font-weight: bold;")
-        self._content_layout.addWidget(header)
+        self._header_label.setText(f"{node.title} ({node.type})")
+        self._header_label.show()
 
         description = node.config.get("_description")
         if isinstance(description, str) and description.strip():
-            desc_label = QLabel(description.strip())
-            desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: palette(mid);")
-            self._content_layout.addWidget(desc_label)
-
-        if node.type == "midi.input":
-            self._build_midi_input_editor(node)
+            self._description_label.setText(description.strip())
+            self._description_label.show()
         else:
-            if node.type == "logic.mapper":
-                self._build_mapper_editor(node)
-            elif node.type == "action.volume":
-                self._build_volume_editor(node)
-            elif node.type == "action.command":
-                self._build_command_editor(node)
-            elif node.type == "action.script":
-                self._build_script_editor(node)
-            elif node.type == "action.shortcut":
-                self._build_shortcut_editor(node)
-            elif node.type == "action.sound":
-                self._build_sound_editor(node)
-            else:
-                self._content_layout.addWidget(QLabel("No editable properties for this node."))
+            self._description_label.hide()
 
-        self._content_layout.addStretch()
-
-    def _build_midi_input_editor(self, node: Node) -> None:
-        form = QFormLayout()
-        container = QWidget(self)
-        container.setLayout(form)
-        self._content_layout.addWidget(container)
+        factory = self._editor_factories.get(node.type)
+        if factory is None:
+            self._show_editor(None)
+            self._show_message("No editable properties for this node.")
+            return
 
-        self._device_combo = QComboBox()
-        self._device_combo.addItem("Any device", "")
+        create, bind = factory
+        editor = self._editor_cache.get(node.type)
+        if editor is None:
+            editor = create()
+            self._editor_stack.addWidget(editor)
+            self._editor_cache[node.type] = editor
+        self._message_label.hide()
+        bind(node)
+        self._show_editor(editor)
+
+    def _show_message(self, text: str) -> None:
+        self._message_label.setText(text)
+        self._message_label.show()
+
+    def _show_editor(self, editor: Optional[QWidget]) -> None:
+        if editor is self._active_editor:
+            return
+        if self._active_editor is not None:
+            # Hidden pages must not contribute to the stack's size hint.
+            self._active_editor.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self._active_editor = editor
+        if editor is None:
+            self._editor_stack.hide()
+            return
+        editor.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self._editor_stack.setCurrentWidget(editor)
+        self._editor_stack.show()
 
-        for device in self._midi_manager.list_input_devices():
-            label = device.name
-            if device.is_virtual:
-                label += " (virtual)"
-            self._device_combo.addItem(label, device.port)
+    def _current_node(self) -> Optional[Node]:
+        if len(self._current_nodes) != 1:
+            return None
+        return self._current_nodes[0]
 
-        device_ports = node.config.get("device_ports") or []
-        selected_port = device_ports[0] if device_ports else ""
-        index = self._device_combo.findData(selected_port)
-        if index == -1:
-            index = 0
-        self._is_updating = True
-        self._device_combo.setCurrentIndex(index)
-        self._is_updating = False
-        self._device_combo.currentIndexChanged.connect(self._handle_device_changed)
-        form.addRow("Device filter", self._device_combo)
+    def _create_midi_input_editor(self) -> QWidget:
+        form = _editor_form()
+        container = QWidget(self)
+        container.setLayout(form)
 
-        profile_id = node.config.get("profile_id")
-        profile = self._profile_store.get(profile_id) if profile_id else None
-        profile_text = profile.name if profile else "No control learned."
-        if profile and profile.control_type:
-            profile_text += f" ({profile.control_type})"
-        self._profile_label = QLabel(profile_text)
+        # Type-to-filter device picker: the completer popup only ever shows
+        # the proxy's matching rows, however many devices are connected.
+        self._device_edit = QLineEdit()
+        self._device_edit.setPlaceholderText("Any device")
+        self._device_edit.setClearButtonEnabled(True)
+        self._device_names = QStringListModel(self)
+        self._device_filter = QSortFilterProxyModel(self)
+        self._device_filter.setSourceModel(self._device_names)
+        self._device_filter.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        completer = QCompleter(self._device_filter, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(12)
+        self._device_edit.setCompleter(completer)
+        self._device_edit.textEdited.connect(self._device_filter.setFilterFixedString)
+        self._device_edit.editingFinished.connect(self._handle_device_committed)
+        completer.activated.connect(lambda _text: self._handle_device_committed())
+        form.addRow("Device filter", self._device_edit)
+
+        self._profile_label = QLabel()
         self._profile_label.setWordWrap(True)
         form.addRow("Assigned control", self._profile_label)
 
         learn_row = QWidget()
-        learn_layout = QVBoxLayout()
-        learn_layout.setContentsMargins(0, 0, 0, 0)
+        learn_layout = _tight_vbox()
         learn_row.setLayout(learn_layout)
 
         self._learn_button = QPushButton("Learn Control")
@@ -196,205 +548,230 @@ class NodeInspector(QGroupBox):
 
         form.addRow("", learn_row)
 
-        form.addRow(self._create_control_type_editor(node))
-
-    def _build_trigger_filter_section(self, node: Node) -> None:
-        form = QFormLayout()
-        container = QWidget(self)
-        container.setLayout(form)
-        self._content_layout.addWidget(container)
+        form.addRow(self._create_control_type_editor())
+        return container
 
-        self._profile_combo = QComboBox()
-        self._profile_combo.addItem("Any control", None)
+    def _bind_midi_input_editor(self, node: Node) -> None:
+        if (
+            self._device_edit is None
+            or self._device_names is None
+            or self._device_filter is None
+            or self._profile_label is None
+        ):
+            return
+        labelled: List[Tuple[str, str]] = []
+        for device in self._midi_manager.list_input_devices():
+            label = device.name
+            if device.is_virtual:
+                label += " (virtual)"
+            labelled.append((label, device.port))
+        label_counts = Counter(label for label, _port in labelled)
+        ports_by_label: Dict[str, str] = {}
+        for label, port in labelled:
+            if label_counts[label] > 1:
+                # Identically named devices stay distinguishable by port.
+                label = f"{label} [{port}]"
+            ports_by_label.setdefault(label, port)
+        selected_port = self._selected_device_port(node)
+        if selected_port and selected_port not in ports_by_label.values():
+            # Keep a filter for a disconnected device visible and selectable.
+            ports_by_label.setdefault(selected_port, selected_port)
+        self._device_ports_by_label = ports_by_label
+        self._device_labels_by_port = {port: label for label, port in ports_by_label.items()}
+        self._device_names.setStringList(list(ports_by_label))
+        self._device_filter.setFilterFixedString("")
+
+        with QSignalBlocker(self._device_edit):
+            self._device_edit.setText(self._device_labels_by_port.get(selected_port, ""))
 
-        for profile in self._profile_store.profiles():
-            device_suffix = f" - {profile.device_port}"
-            text = f"{profile.name}{device_suffix}"
-            self._profile_combo.addItem(text, profile.id)
+        profile_id = node.config.get("profile_id")
+        profile = self._profile_store.get(profile_id) if profile_id else None
+        profile_text = profile.name if profile else "No control learned."
+        if profile and profile.control_type:
+            profile_text += f" ({profile.control_type})"
+        self._profile_label.setText(profile_text)
 
-        current_profile_id = node.config.get("profile_id")
-        index = self._profile_combo.findData(current_profile_id)
-        self._is_updating = True
-        if index != -1:
-            self._profile_combo.setCurrentIndex(index)
-        else:
-            self._profile_combo.setCurrentIndex(0)
-        self._is_updating = False
+        self._bind_control_type_editor(node)
 
-        self._profile_combo.currentIndexChanged.connect(self._handle_profile_changed)
-        form.addRow("Trigger profile", self._profile_combo)
+    def _create_trigger_filter_section(self, form: QFormLayout, node_type: str) -> None:
+        # Empty slot; the shared profile combo is moved in when the editor is bound.
+        slot = QWidget()
+        slot_layout = _tight_vbox()
+        slot.setLayout(slot_layout)
+        form.addRow("Trigger profile", slot)
+        self._trigger_filter_slots[node_type] = slot
 
-    def _build_mapper_editor(self, node: Node) -> None:
-        form = QFormLayout()
-        container = QWidget(self)
-        container.setLayout(form)
-        self._content_layout.addWidget(container)
+    def _bind_trigger_filter_section(self, node: Node) -> None:
+        slot = self._trigger_filter_slots.get(node.type)
+        if slot is None:
+            return
+        combo = self._profile_combo
+        previous = combo.parentWidget()
+        if previous is not slot:
+            if previous is not None and previous.layout() is not None:
+                previous.layout().removeWidget(combo)
+            slot.layout().addWidget(combo)
+
+        with QSignalBlocker(combo):
+            if self._profile_items_revision != self._profile_store.revision:
+                self._profile_model.set_items(self._profile_choice_items())
+
+            combo.setCurrentIndex(self._profile_model.row_for(node.config.get("profile_id")))
+
+    def _profile_choice_items(self) -> List[ChoiceItem]:
+        """
+        Return the cached ``(label, profile_id)`` combo items, rebuilding them
+        only when the profile store's revision has moved on.
+        """
+
+        revision = self._profile_store.revision
+        if self._profile_items is None or revision != self._profile_items_revision:
+            items: List[ChoiceItem] = [("Any control", None)]
+            for profile in self._profile_store.profiles():
+                device_suffix = f" - {profile.device_port}"
+                items.append((f"{profile.name}{device_suffix}", profile.id))
+            self._profile_items = items
+            self._profile_items_revision = revision
+        return self._profile_items
+
+    def _invalidate_profile_cache(self) -> None:
+        self._profile_items = None
+        self._profile_items_revision = None
+
+    def _handle_mapper_config_changed(self, node_id: str, key: str, value) -> None:
+        node = self._current_node()
+        if node is None or node.id != node_id:
+            return
+        self._set_config_value(node, key, value)
 
-        input_min = int(node.config.get("input_min", 0))
-        input_max = int(node.config.get("input_max", 127))
-        output_min = float(node.config.get("output_min", 0.0))
-        output_max = float(node.config.get("output_max", 1.0))
-        curve = str(node.config.get("curve", "linear"))
-        steps = int(node.config.get("steps", 8))
-
-        in_min_spin = QSpinBox()
-        in_min_spin.setRange(0, 127)
-        in_min_spin.setValue(input_min)
-        in_max_spin = QSpinBox()
-        in_max_spin.setRange(0, 127)
-        in_max_spin.setValue(input_max)
-        out_min_spin = QDoubleSpinBox()
-        out_min_spin.setRange(0.0, 1.0)
-        out_min_spin.setSingleStep(0.01)
-        out_min_spin.setValue(output_min)
-        out_max_spin = QDoubleSpinBox()
-        out_max_spin.setRange(0.0, 1.0)
-        out_max_spin.setSingleStep(0.01)
-        out_max_spin.setValue(output_max)
-
-        curve_combo = QComboBox()
-        curve_combo.addItems(["linear", "log", "exp", "step"])
-        index = curve_combo.findText(curve)
-        if index != -1:
-            curve_combo.setCurrentIndex(index)
-
-        steps_spin = QSpinBox()
-        steps_spin.setRange(2, 128)
-        steps_spin.setValue(max(2, steps))
-        steps_spin.setEnabled(curve == "step")
-
-        form.addRow("Input min", in_min_spin)
-        form.addRow("Input max", in_max_spin)
-        form.addRow("Output min", out_min_spin)
-        form.addRow("Output max", out_max_spin)
-        form.addRow("Curve", curve_combo)
-        form.addRow("Steps", steps_spin)
-
-        self._mapper_inputs = (in_min_spin, in_max_spin)
-        self._mapper_outputs = (out_min_spin, out_max_spin)
-        self._mapper_curve_combo = curve_combo
-        self._mapper_steps_spin = steps_spin
-
-        in_min_spin.valueChanged.connect(lambda value: self._set_config_value(node, "input_min", int(value)))
-        in_max_spin.valueChanged.connect(lambda value: self._set_config_value(node, "input_max", int(value)))
-        out_min_spin.valueChanged.connect(lambda value: self._set_config_value(node, "output_min", float(value)))
-        out_max_spin.valueChanged.connect(lambda value: self._set_config_value(node, "output_max", float(value)))
-
-        def on_curve_changed(index: int) -> None:
-            if self._is_updating:
-                return
-            value = curve_combo.itemText(index)
-            steps_spin.setEnabled(value == "step")
-            self._set_config_value(node, "curve", value)
-
-        curve_combo.currentIndexChanged.connect(on_curve_changed)
-        steps_spin.valueChanged.connect(lambda value: self._set_config_value(node, "steps", int(value)))
-
-    def _build_volume_editor(self, node: Node) -> None:
-        form = QFormLayout()
+    def _create_volume_editor(self) -> QWidget:
+        form = _editor_form()
         container = QWidget(self)
         container.setLayout(form)
-        self._content_layout.addWidget(container)
 
-        self._volume_target_combo = QComboBox()
+        self._volume_target_combo, self._volume_target_model = _choice_combo()
         self._volume_refresh_button = QPushButton("Refresh Targets")
         target_row = QHBoxLayout()
         target_row.addWidget(self._volume_target_combo)
         target_row.addWidget(self._volume_refresh_button)
         form.addRow("Audio target", target_row)
 
-        self._populate_volume_targets(node)
-        self._volume_target_combo.currentIndexChanged.connect(lambda _: self._handle_volume_target_changed(node))
-        self._volume_refresh_button.clicked.connect(lambda: self._populate_volume_targets(node))
+        self._volume_target_combo.currentIndexChanged.connect(lambda _: self._handle_volume_target_changed())
+        self._volume_refresh_button.clicked.connect(self._refresh_volume_targets)
 
         input_min = QSpinBox()
         input_min.setRange(0, 127)
-        input_min.setValue(int(node.config.get("input_min", 0)))
         input_max = QSpinBox()
         input_max.setRange(0, 127)
-        input_max.setValue(int(node.config.get("input_max", 127)))
         output_min = QDoubleSpinBox()
         output_min.setRange(0.0, 1.0)
         output_min.setSingleStep(0.01)
-        output_min.setValue(float(node.config.get("output_min", 0.0)))
         output_max = QDoubleSpinBox()
         output_max.setRange(0.0, 1.0)
         output_max.setSingleStep(0.01)
-        output_max.setValue(float(node.config.get("output_max", 1.0)))
 
         form.addRow("Input min", input_min)
         form.addRow("Input max", input_max)
         form.addRow("Output min", output_min)
         form.addRow("Output max", output_max)
 
-        input_min.valueChanged.connect(lambda value: self._set_config_value(node, "input_min", int(value)))
-        input_max.valueChanged.connect(lambda value: self._set_config_value(node, "input_max", int(value)))
-        output_min.valueChanged.connect(lambda value: self._set_config_value(node, "output_min", float(value)))
-        output_max.valueChanged.connect(lambda value: self._set_config_value(node, "output_max", float(value)))
+        self._volume_inputs = (input_min, input_max)
+        self._volume_outputs = (output_min, output_max)
+
+        input_min.valueChanged.connect(lambda value: self._set_current_config("input_min", int(value)))
+        input_max.valueChanged.connect(lambda value: self._set_current_config("input_max", int(value)))
+        output_min.valueChanged.connect(lambda value: self._set_current_config("output_min", float(value)))
+        output_max.valueChanged.connect(lambda value: self._set_current_config("output_max", float(value)))
+
+        self._create_trigger_filter_section(form, "action.volume")
+        return container
+
+    def _bind_volume_editor(self, node: Node) -> None:
+        if self._volume_inputs is None or self._volume_outputs is None:
+            return
+        self._populate_volume_targets(node)
+
+        input_min, input_max = self._volume_inputs
+        output_min, output_max = self._volume_outputs
+        with _signals_blocked(input_min, input_max, output_min, output_max):
+            input_min.setValue(int(node.config.get("input_min", 0)))
+            input_max.setValue(int(node.config.get("input_max", 127)))
+            output_min.setValue(float(node.config.get("output_min", 0.0)))
+            output_max.setValue(float(node.config.get("output_max", 1.0)))
 
-        self._build_trigger_filter_section(node)
+        self._bind_trigger_filter_section(node)
+
+    def _refresh_volume_targets(self) -> None:
+        self._volume_targets_cache = None
+        self._request_volume_targets()
+
+    def _request_volume_targets(self) -> None:
+        if self._volume_targets_pending:
+            return
+        self._volume_targets_pending = True
+        QThreadPool.globalInstance().start(_AudioTargetsTask(self._audio_targets_signals))
+
+    def _on_volume_targets_listed(self, targets) -> None:
+        self._volume_targets_pending = False
+        items: List[ChoiceItem] = []
+        rows_by_id: Dict[str, int] = {}
+        default_row = 0
+        for row, target in enumerate(targets):
+            items.append((f"{target.name} ({target.kind})", (target.id, target.kind)))
+            rows_by_id[target.id] = row
+            if target.kind == "default":
+                default_row = row
+        self._volume_targets_cache = _AudioTargetListing(items, rows_by_id, default_row, time.monotonic())
+        node = self._current_node()
+        if node is not None and node.type == "action.volume":
+            self._populate_volume_targets(node)
 
     def _populate_volume_targets(self, node: Node) -> None:
-        if self._volume_target_combo is None:
+        if self._volume_target_combo is None or self._volume_target_model is None:
             return
-        self._is_updating = True
-        self._volume_target_combo.clear()
-        self._volume_targets = list_audio_targets()
-        if not self._volume_targets:
-            self._volume_target_combo.addItem("System Default Output", ("@DEFAULT", "default"))
-            selected_id = str(node.config.get("target_id") or "@DEFAULT_AUDIO_SINK@")
-            if selected_id.startswith("@DEFAULT"):
-                self._volume_target_combo.setCurrentIndex(0)
-            self._is_updating = False
+        cache = self._volume_targets_cache
+        if cache is None or time.monotonic() - cache.listed_at >= AUDIO_TARGETS_TTL:
+            # Show what we have now; the worker patches the combo when it returns.
+            self._request_volume_targets()
+
+        if cache is None or not cache.items:
+            with QSignalBlocker(self._volume_target_combo):
+                self._volume_target_model.set_items([("System Default Output", ("@DEFAULT", "default"))])
+                selected_id = str(node.config.get("target_id") or "@DEFAULT_AUDIO_SINK@")
+                if selected_id.startswith("@DEFAULT"):
+                    self._volume_target_combo.setCurrentIndex(0)
             return
 
         selected_id = str(node.config.get("target_id") or "")
-        selected_kind = str(node.config.get("target_kind") or "")
-        best_index = 0
-        for target in self._volume_targets:
-            label = f"{target.name} ({target.kind})"
-            self._volume_target_combo.addItem(label, (target.id, target.kind))
-            if target.id == selected_id or (not selected_id and target.kind == "default"):
-                best_index = self._volume_target_combo.count() - 1
-        self._volume_target_combo.setCurrentIndex(best_index)
-        self._is_updating = False
-
-    def _handle_volume_target_changed(self, node: Node) -> None:
-        if self._is_updating or self._volume_target_combo is None:
+        best_index = cache.rows_by_id.get(selected_id, 0) if selected_id else cache.default_row
+        with QSignalBlocker(self._volume_target_combo):
+            self._volume_target_model.set_items(cache.items)
+            self._volume_target_combo.setCurrentIndex(best_index)
+
+    def _handle_volume_target_changed(self) -> None:
+        node = self._current_node()
+        if self._volume_target_combo is None or node is None:
             return
         data = self._volume_target_combo.currentData()
         if isinstance(data, tuple) and len(data) == 2:
             target_id, target_kind = data
-            self._set_config_value(node, "target_id", target_id)
-            self._set_config_value(node, "target_kind", target_kind)
+            self._batch_set(node, {"target_id": target_id, "target_kind": target_kind})
 
-    def _build_command_editor(self, node: Node) -> None:
-        form = QFormLayout()
+    def _create_command_editor(self) -> QWidget:
+        form = _editor_form()
         container = QWidget(self)
         container.setLayout(form)
-        self._content_layout.addWidget(container)
 
         command_edit = QLineEdit()
         command_edit.setPlaceholderText("e.g. /usr/bin/xdotool")
-        current_command = node.config.get("command", "")
-        if isinstance(current_command, (list, tuple)):
-            current_command = " ".join(str(part) for part in current_command)
-        command_edit.setText(str(current_command or ""))
 
         args_edit = QLineEdit()
         args_edit.setPlaceholderText("Arguments (optional)")
-        args = node.config.get("args")
-        if isinstance(args, (list, tuple)):
-            args_edit.setText(" ".join(str(part) for part in args))
-        elif isinstance(args, str):
-            args_edit.setText(args)
 
         cwd_edit = QLineEdit()
         cwd_edit.setPlaceholderText("Working directory (optional)")
-        cwd_edit.setText(str(node.config.get("cwd") or ""))
 
         shell_checkbox = QCheckBox("Run in shell")
-        shell_checkbox.setChecked(bool(node.config.get("shell")))
 
         form.addRow("Command", command_edit)
         form.addRow("Arguments", args_edit)
@@ -406,15 +783,47 @@ class NodeInspector(QGroupBox):
         self._command_cwd_edit = cwd_edit
         self._command_shell_checkbox = shell_checkbox
 
-        command_edit.editingFinished.connect(lambda: self._update_command_config(node))
-        args_edit.editingFinished.connect(lambda: self._update_command_config(node))
-        cwd_edit.editingFinished.connect(lambda: self._update_command_config(node))
-        shell_checkbox.toggled.connect(lambda _: self._update_command_config(node))
+        command_edit.editingFinished.connect(self._update_command_config)
+        args_edit.editingFinished.connect(self._update_command_config)
+        cwd_edit.editingFinished.connect(self._update_command_config)
+        shell_checkbox.toggled.connect(lambda _: self._update_command_config())
 
-        self._build_trigger_filter_section(node)
+        self._create_trigger_filter_section(form, "action.command")
+        return container
+
+    def _bind_command_editor(self, node: Node) -> None:
+        if (
+            self._command_command_edit is None
+            or self._command_args_edit is None
+            or self._command_cwd_edit is None
+            or self._command_shell_checkbox is None
+        ):
+            return
+        current_command = node.config.get("command", "")
+        if isinstance(current_command, (list, tuple)):
+            current_command = " ".join(str(part) for part in current_command)
+
+        args = node.config.get("args")
+        if isinstance(args, (list, tuple)):
+            args_text = " ".join(str(part) for part in args)
+        elif isinstance(args, str):
+            args_text = args
+        else:
+            args_text = ""
+
+        with _signals_blocked(
+            self._command_command_edit, self._command_args_edit, self._command_cwd_edit, self._command_shell_checkbox
+        ):
+            self._command_command_edit.setText(str(current_command or ""))
+            self._command_args_edit.setText(args_text)
+            self._command_cwd_edit.setText(str(node.config.get("cwd") or ""))
+            self._command_shell_checkbox.setChecked(bool(node.config.get("shell")))
+
+        self._bind_trigger_filter_section(node)
 
-    def _update_command_config(self, node: Node) -> None:
-        if self._is_updating:
+    def _update_command_config(self) -> None:
+        node = self._current_node()
+        if node is None:
             return
         command = ""
         args_value = []
@@ -424,88 +833,141 @@ class NodeInspector(QGroupBox):
             command = self._command_command_edit.text().strip()
         if self._command_args_edit is not None:
             raw_args = self._command_args_edit.text().strip()
-            if raw_args:
-                import shlex
-
-                try:
-                    args_value = shlex.split(raw_args)
-                except ValueError:
-                    args_value = raw_args.split()
-            else:
-                args_value = []
+            args_value = list(_parse_args(raw_args)) if raw_args else []
         if self._command_cwd_edit is not None:
             cwd_value = self._command_cwd_edit.text().strip()
         if self._command_shell_checkbox is not None:
             shell_value = self._command_shell_checkbox.isChecked()
 
-        self._set_config_value(node, "command", command)
-        self._set_config_value(node, "args", args_value)
-        self._set_config_value(node, "cwd", cwd_value)
-        self._set_config_value(node, "shell", shell_value)
+        self._batch_set(
+            node,
+            {"command": command, "args": args_value, "cwd": cwd_value, "shell": shell_value},
+        )
 
-    def _build_script_editor(self, node: Node) -> None:
-        form = QFormLayout()
+    def _create_script_editor(self) -> QWidget:
+        form = _editor_form()
         container = QWidget(self)
         container.setLayout(form)
-        self._content_layout.addWidget(container)
 
-        script_edit = QPlainTextEdit()
-        script_edit.setPlaceholderText("# Write Python code here\n")
-        script_edit.setPlainText(str(node.config.get("script") or ""))
-        script_edit.textChanged.connect(lambda: self._handle_script_changed(node))
-        form.addRow("Script", script_edit)
+        # The QPlainTextEdit is only built once the user asks to edit a script.
+        script_area = QWidget()
+        self._script_layout = _tight_vbox()
+        script_area.setLayout(self._script_layout)
 
-        self._script_edit = script_edit
+        self._script_summary_label = QLabel()
+        self._script_summary_label.setWordWrap(True)
+        self._script_summary_label.setStyleSheet("color: palette(mid);")
+        self._script_layout.addWidget(self._script_summary_label)
+
+        self._script_open_button = QPushButton("Edit script…")
+        self._script_open_button.clicked.connect(self._open_script_edit)
+        self._script_layout.addWidget(self._script_open_button)
+        form.addRow("Script", script_area)
 
         note = QLabel("The script executes with variables: event, node, context.")
         note.setWordWrap(True)
         note.setStyleSheet("color: palette(mid);")
         form.addRow("", note)
 
-        self._build_trigger_filter_section(node)
+        self._create_trigger_filter_section(form, "action.script")
+        return container
+
+    def _bind_script_editor(self, node: Node) -> None:
+        self._flush_script_edit()
+        self._script_node = node
+        script = str(node.config.get("script") or "")
+        if self._script_edit is not None:
+            with QSignalBlocker(self._script_edit):
+                self._script_edit.setPlainText(script)
+        elif self._script_summary_label is not None:
+            self._script_summary_label.setText(self._script_summary(script))
+
+        self._bind_trigger_filter_section(node)
+
+    def _open_script_edit(self) -> None:
+        if self._script_edit is not None or self._script_open_button is None:
+            return
+        script_edit = QPlainTextEdit()
+        script_edit.setPlaceholderText("# Write Python code here\n")
+        if self._script_node is not None:
+            script_edit.setPlainText(str(self._script_node.config.get("script") or ""))
+        script_edit.textChanged.connect(self._handle_script_changed)
+        script_edit.installEventFilter(self)
+
+        self._script_layout.replaceWidget(self._script_open_button, script_edit)
+        self._script_open_button.deleteLater()
+        self._script_open_button = None
+        if self._script_summary_label is not None:
+            self._script_summary_label.hide()
+        self._script_edit = script_edit
+        script_edit.setFocus()
+
+    @staticmethod
+    def _script_summary(script: str) -> str:
+        stripped = script.strip()
+        if not stripped:
+            return "No script."
+        first_line = stripped.splitlines()[0]
+        return f"{first_line} ({len(script)} characters)"
+
+    def _handle_script_changed(self) -> None:
+        if self._script_edit is None:
+            return
+        self._script_commit_timer.start()
+
+    def _flush_script_edit(self) -> None:
+        if not self._script_commit_timer.isActive():
+            return
+        self._script_commit_timer.stop()
+        self._commit_script_edit()
 
-    def _handle_script_changed(self, node: Node) -> None:
-        if self._is_updating or self._script_edit is None:
+    def _commit_script_edit(self) -> None:
+        if self._script_edit is None or self._script_node is None:
             return
-        self._set_config_value(node, "script", self._script_edit.toPlainText())
+        self._set_config_value(self._script_node, "script", self._script_edit.toPlainText())
 
-    def _build_shortcut_editor(self, node: Node) -> None:
-        form = QFormLayout()
+    def _create_shortcut_editor(self) -> QWidget:
+        form = _editor_form()
         container = QWidget(self)
         container.setLayout(form)
-        self._content_layout.addWidget(container)
 
         sequence_edit = QLineEdit()
         sequence_edit.setPlaceholderText("ctrl+alt+k")
-        sequence_edit.setText(str(node.config.get("sequence") or ""))
         sequence_edit.editingFinished.connect(
-            lambda: self._set_config_value(node, "sequence", sequence_edit.text().strip())
+            lambda: self._set_current_config("sequence", sequence_edit.text().strip())
         )
         form.addRow("Shortcut sequence", sequence_edit)
+        self._shortcut_edit = sequence_edit
 
         hint = QLabel("Shortcut is passed to xdotool's `key` command (install xdotool).")
         hint.setWordWrap(True)
         hint.setStyleSheet("color: palette(mid);")
         form.addRow("", hint)
 
-        self._build_trigger_filter_section(node)
+        self._create_trigger_filter_section(form, "action.shortcut")
+        return container
 
-    def _build_sound_editor(self, node: Node) -> None:
-        form = QFormLayout()
+    def _bind_shortcut_editor(self, node: Node) -> None:
+        if self._shortcut_edit is None:
+            return
+        with QSignalBlocker(self._shortcut_edit):
+            self._shortcut_edit.setText(str(node.config.get("sequence") or ""))
+
+        self._bind_trigger_filter_section(node)
+
+    def _create_sound_editor(self) -> QWidget:
+        form = _editor_form()
         container = QWidget(self)
         container.setLayout(form)
-        self._content_layout.addWidget(container)
 
         path_row = QHBoxLayout()
         path_edit = QLineEdit()
         path_edit.setPlaceholderText("/path/to/sample.wav")
-        current_path = str(node.config.get("file") or node.config.get("path") or "")
-        path_edit.setText(current_path)
 
         browse_button = QPushButton("Browse…")
-        browse_button.clicked.connect(lambda: self._handle_sound_browse(node, path_edit))
+        browse_button.clicked.connect(self._handle_sound_browse)
 
-        path_edit.editingFinished.connect(lambda: self._handle_sound_path_changed(node, path_edit))
+        path_edit.editingFinished.connect(self._handle_sound_path_changed)
 
         path_row.addWidget(path_edit)
         path_row.addWidget(browse_button)
@@ -515,38 +977,28 @@ class NodeInspector(QGroupBox):
         volume_spin.setRange(0.0, 1.0)
         volume_spin.setSingleStep(0.05)
         volume_spin.setDecimals(2)
-        try:
-            current_volume = float(node.config.get("volume", 1.0))
-        except (TypeError, ValueError):
-            current_volume = 1.0
-        volume_spin.setValue(max(0.0, min(1.0, current_volume)))
-        volume_spin.valueChanged.connect(lambda value: self._set_config_value(node, "volume", float(value)))
+        volume_spin.valueChanged.connect(lambda value: self._set_current_config("volume", float(value)))
         form.addRow("Volume", volume_spin)
 
         trigger_spin = QSpinBox()
         trigger_spin.setRange(-1, 127)
         trigger_spin.setSpecialValueText("Any value")
-        trigger_value = node.config.get("trigger_value")
-        trigger_spin.setValue(int(trigger_value) if trigger_value is not None else -1)
         trigger_spin.valueChanged.connect(
-            lambda value: self._set_optional_int_config(node, "trigger_value", value)
+            lambda value: self._set_optional_int_config("trigger_value", value)
         )
         form.addRow("Trigger value", trigger_spin)
 
         min_spin = QSpinBox()
         min_spin.setRange(-1, 127)
         min_spin.setSpecialValueText("Disabled")
-        min_value = node.config.get("min_value")
-        min_spin.setValue(int(min_value) if min_value is not None else -1)
         min_spin.valueChanged.connect(
-            lambda value: self._set_optional_int_config(node, "min_value", value)
+            lambda value: self._set_optional_int_config("min_value", value)
         )
         form.addRow("Minimum value", min_spin)
 
         note_off_checkbox = QCheckBox("Trigger on note-off messages")
-        note_off_checkbox.setChecked(bool(node.config.get("trigger_on_note_off")))
         note_off_checkbox.toggled.connect(
-            lambda checked: self._set_config_value(node, "trigger_on_note_off", bool(checked))
+            lambda checked: self._set_current_config("trigger_on_note_off", bool(checked))
         )
         form.addRow("", note_off_checkbox)
 
@@ -557,27 +1009,64 @@ class NodeInspector(QGroupBox):
         info_label.setStyleSheet("color: palette(mid);")
         form.addRow("", info_label)
 
-        self._build_trigger_filter_section(node)
+        self._sound_path_edit = path_edit
+        self._sound_volume_spin = volume_spin
+        self._sound_trigger_spin = trigger_spin
+        self._sound_min_spin = min_spin
+        self._sound_note_off_checkbox = note_off_checkbox
+
+        self._create_trigger_filter_section(form, "action.sound")
+        return container
+
+    def _bind_sound_editor(self, node: Node) -> None:
+        if (
+            self._sound_path_edit is None
+            or self._sound_volume_spin is None
+            or self._sound_trigger_spin is None
+            or self._sound_min_spin is None
+            or self._sound_note_off_checkbox is None
+        ):
+            return
+        try:
+            current_volume = float(node.config.get("volume", 1.0))
+        except (TypeError, ValueError):
+            current_volume = 1.0
+        trigger_value = node.config.get("trigger_value")
+        min_value = node.config.get("min_value")
 
-    def _handle_sound_path_changed(self, node: Node, edit: QLineEdit) -> None:
-        if self._is_updating:
+        with _signals_blocked(
+            self._sound_path_edit,
+            self._sound_volume_spin,
+            self._sound_trigger_spin,
+            self._sound_min_spin,
+            self._sound_note_off_checkbox,
+        ):
+            self._sound_path_edit.setText(str(node.config.get("file") or node.config.get("path") or ""))
+            self._sound_volume_spin.setValue(max(0.0, min(1.0, current_volume)))
+            self._sound_trigger_spin.setValue(int(trigger_value) if trigger_value is not None else -1)
+            self._sound_min_spin.setValue(int(min_value) if min_value is not None else -1)
+            self._sound_note_off_checkbox.setChecked(bool(node.config.get("trigger_on_note_off")))
+
+        self._bind_trigger_filter_section(node)
+
+    def _handle_sound_path_changed(self) -> None:
+        node = self._current_node()
+        if self._sound_path_edit is None or node is None:
             return
-        value = edit.text().strip()
+        value = self._sound_path_edit.text().strip()
         if not value:
-            if "file" in node.config:
-                node.config["file"] = ""
-                self._emit_config_changed(node.id)
-            if "path" in node.config:
-                node.config["path"] = ""
-                self._emit_config_changed(node.id)
-            return
-        self._set_config_value(node, "file", value)
+            self._batch_set(node, {key: "" for key in ("file", "path") if key in node.config})
+            return
+        updates = {"file": value}
         if node.config.get("path") not in ("", value):
-            self._set_config_value(node, "path", value)
+            updates["path"] = value
+        self._batch_set(node, updates)
 
-    def _handle_sound_browse(self, node: Node, edit: QLineEdit) -> None:
+    def _handle_sound_browse(self) -> None:
+        if self._sound_path_edit is None:
+            return
         options = QFileDialog.Options()
-        start_dir = Path(edit.text().strip() or str(Path.home()))
+        start_dir = Path(self._sound_path_edit.text().strip() or str(Path.home()))
         directory = str(start_dir if start_dir.is_dir() else start_dir.parent)
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -587,43 +1076,77 @@ class NodeInspector(QGroupBox):
             options=options,
         )
         if file_path:
-            edit.setText(file_path)
-            self._handle_sound_path_changed(node, edit)
+            self._sound_path_edit.setText(file_path)
+            self._handle_sound_path_changed()
 
-    def _set_optional_int_config(self, node: Node, key: str, value: int) -> None:
+    def _set_optional_int_config(self, key: str, value: int) -> None:
+        node = self._current_node()
+        if node is None:
+            return
         if value < 0:
-            removed = node.config.pop(key, None)
-            if removed is not None:
-                self._emit_config_changed(node.id)
+            self._batch_set(node, {}, remove=(key,))
             return
         self._set_config_value(node, key, int(value))
 
-    def _handle_device_changed(self, index: int) -> None:
-        if self._is_updating:
+    @staticmethod
+    def _selected_device_port(node: Node) -> str:
+        device_ports = node.config.get("device_ports") or []
+        return device_ports[0] if device_ports else ""
+
+    def _handle_device_committed(self) -> None:
+        node = self._current_node()
+        if node is None or self._device_edit is None:
             return
-        if not self._current_nodes:
+        text = self._device_edit.text().strip()
+        current_port = self._selected_device_port(node)
+        if text and text not in self._device_ports_by_label:
+            # Unknown name: fall back to the filter that is still in effect.
+            with QSignalBlocker(self._device_edit):
+                self._device_edit.setText(self._device_labels_by_port.get(current_port, ""))
+            return
+        port = self._device_ports_by_label.get(text, "")
+        if port == current_port:
             return
-        data = self._device_combo.itemData(index) if self._device_combo else ""
-        ports = [data] if data else []
-        self.deviceFilterChanged.emit(self._current_nodes[0].id, ports)
+        self.deviceFilterChanged.emit(node.id, [port] if port else [])
 
     def _handle_profile_changed(self, index: int) -> None:
-        if self._is_updating:
-            return
         if not self._current_nodes:
             return
-        profile_id = self._profile_combo.itemData(index) if self._profile_combo else None
+        profile_id = self._profile_combo.itemData(index)
         self.profileAssigned.emit(self._current_nodes[0].id, profile_id)
 
-    def _set_config_value(self, node: Node, key: str, value) -> None:
-        current = node.config.get(key)
-        if current == value:
+    def _set_current_config(self, key: str, value) -> None:
+        node = self._current_node()
+        if node is None:
             return
-        node.config[key] = value
-        self._emit_config_changed(node.id)
+        self._set_config_value(node, key, value)
+
+    def _set_config_value(self, node: Node, key: str, value) -> None:
+        self._batch_set(node, {key: value})
+
+    def _batch_set(self, node: Node, updates: Dict[str, object], remove: Iterable[str] = ()) -> None:
+        """
+        Apply several config changes and emit configChanged at most once.
+
+        Keys in ``remove`` are popped when present; ``None`` values count as absent.
+        """
+        config = node.config
+        changed = {key: value for key, value in updates.items() if config.get(key) != value}
+        config.update(changed)
+        removed = [config.pop(key, None) for key in remove]
+        if changed or any(value is not None for value in removed):
+            self._emit_config_changed(node.id)
 
     def _emit_config_changed(self, node_id: str) -> None:
-        self.configChanged.emit(node_id)
+        self._pending_config_ids[node_id] = None
+        if not self._config_changed_timer.isActive():
+            self._config_changed_timer.start()
+
+    def _flush_config_changed(self) -> None:
+        node_ids = list(self._pending_config_ids)
+        self._pending_config_ids.clear()
+        for node_id in node_ids:
+            self.configChanged.emit(node_id)
 
     def _on_learn_clicked(self) -> None:
         if not self._current_nodes:
@@ -635,76 +1158,66 @@ class NodeInspector(QGroupBox):
             return
         self.profileAssigned.emit(self._current_nodes[0].id, None)
 
-    def _clear_content(self) -> None:
-        self._control_type_combo = None
-        self._control_type_custom_edit = None
-        while self._content_layout.count():
-            item = self._content_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
-    def _create_control_type_editor(self, node: Node) -> QWidget:
+    def _create_control_type_editor(self) -> QWidget:
         container = QWidget(self)
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = _tight_vbox()
         container.setLayout(layout)
 
         combo = QComboBox()
-        combo.addItem("Auto (from learned control)", "auto")
-        combo.addItem("Key / Button", "key")
-        combo.addItem("Pad", "pad")
-        combo.addItem("Fader / Slider", "fader")
-        combo.addItem("Knob / Dial", "knob")
-        combo.addItem("Custom label…", "custom")
-
-        stored_mode = str(node.config.get("display_control_type") or "auto")
-        index = combo.findData(stored_mode)
-        if index == -1:
-            index = 0
-        self._is_updating = True
-        combo.setCurrentIndex(index)
-        self._is_updating = False
-
-        combo.currentIndexChanged.connect(lambda idx: self._handle_control_display_changed(node, idx))
+        combo.setModel(_shared_choice_model("control_types", _CONTROL_TYPE_ITEMS))
+        combo.currentIndexChanged.connect(self._handle_control_display_changed)
         layout.addWidget(combo)
         self._control_type_combo = combo
 
         custom_edit = QLineEdit()
         custom_edit.setPlaceholderText("Custom label (e.g. Drum Pad)")
-        custom_edit.setText(str(node.config.get("display_control_label") or ""))
-        custom_edit.editingFinished.connect(lambda: self._handle_control_label_changed(node))
+        custom_edit.editingFinished.connect(self._handle_control_label_changed)
         layout.addWidget(custom_edit)
         self._control_type_custom_edit = custom_edit
 
-        mode = combo.currentData()
-        custom_edit.setVisible(mode == "custom")
-
         return container
 
-    def _handle_control_display_changed(self, node: Node, index: int) -> None:
-        if self._is_updating or self._control_type_combo is None:
+    def _bind_control_type_editor(self, node: Node) -> None:
+        if self._control_type_combo is None or self._control_type_custom_edit is None:
+            return
+        stored_mode = str(node.config.get("display_control_type") or "auto")
+        index = _shared_choice_model("control_types", _CONTROL_TYPE_ITEMS).row_for(stored_mode)
+        with _signals_blocked(self._control_type_combo, self._control_type_custom_edit):
+            self._control_type_combo.setCurrentIndex(index)
+            self._control_type_custom_edit.setText(str(node.config.get("display_control_label") or ""))
+
+        mode = self._control_type_combo.currentData()
+        self._control_type_custom_edit.setVisible(mode == "custom")
+
+    def _handle_control_display_changed(self, index: int) -> None:
+        node = self._current_node()
+        if self._control_type_combo is None or node is None:
             return
 
         mode = self._control_type_combo.itemData(index) or "auto"
-        self._set_config_value(node, "display_control_type", mode)
-
         custom_visible = mode == "custom"
+        self._batch_set(
+            node,
+            {"display_control_type": mode},
+            remove=() if custom_visible else ("display_control_label",),
+        )
         if self._control_type_custom_edit is not None:
             self._control_type_custom_edit.setVisible(custom_visible)
-        if not custom_visible:
-            removed = node.config.pop("display_control_label", None)
-            if removed is not None:
-                self._emit_config_changed(node.id)
 
-    def _handle_control_label_changed(self, node: Node) -> None:
-        if self._is_updating or self._control_type_custom_edit is None:
+    def _handle_control_label_changed(self) -> None:
+        node = self._current_node()
+        if self._control_type_custom_edit is None or node is None:
             return
         text = self._control_type_custom_edit.text().strip()
         if not text:
-            removed = node.config.pop("display_control_label", None)
-            if removed is not None:
-                self._emit_config_changed(node.id)
+            self._batch_set(node, {}, remove=("display_control_label",))
             return
         self._set_config_value(node, "display_control_label", text)
 
+
+@lru_cache(maxsize=32)
+def _parse_args(raw: str) -> Tuple[str, ...]:
+    try:
+        return tuple(shlex.split(raw))
+    except ValueError:
+        return tuple(raw.split())
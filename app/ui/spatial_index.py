@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Hashable, Iterator, Set, Tuple
+
+from PySide6.QtCore import QRectF
+
+CellSpan = Tuple[int, int, int, int]
+
+
+class GridIndex:
+    """
+    Uniform-grid spatial hash for axis-aligned scene rectangles.
+
+    Queries return candidate keys whose cells overlap the query area; callers
+    are expected to run their exact hit-test on the (small) candidate set.
+    """
+
+    def __init__(self, cell_size: float = 256.0) -> None:
+        self._cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._entries: Dict[Hashable, CellSpan] = {}
+
+    def insert(self, key: Hashable, rect: QRectF) -> None:
+        span = self._span(rect.left(), rect.top(), rect.right(), rect.bottom())
+        previous = self._entries.get(key)
+        if previous == span:
+            return
+        if previous is not None:
+            self._discard(key, previous)
+        self._entries[key] = span
+        for cell in self._cells_in(span):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = self._cells[cell] = set()
+            bucket.add(key)
+
+    def remove(self, key: Hashable) -> None:
+        span = self._entries.pop(key, None)
+        if span is not None:
+            self._discard(key, span)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entries.clear()
+
+    def intersection(self, rect: QRectF) -> Set[Hashable]:
+        span = self._span(rect.left(), rect.top(), rect.right(), rect.bottom())
+        left, top, right, bottom = span
+        hits: Set[Hashable] = set()
+        if (right - left + 1) * (bottom - top + 1) > len(self._cells):
+            # Query covers more cells than are populated: walk the populated ones.
+            for (cx, cy), bucket in self._cells.items():
+                if left <= cx <= right and top <= cy <= bottom:
+                    hits.update(bucket)
+            return hits
+        for cell in self._cells_in(span):
+            bucket = self._cells.get(cell)
+            if bucket:
+                hits.update(bucket)
+        return hits
+
+    def _discard(self, key: Hashable, span: CellSpan) -> None:
+        for cell in self._cells_in(span):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if not bucket:
+                del self._cells[cell]
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self._cell_size)
+
+    def _span(self, left: float, top: float, right: float, bottom: float) -> CellSpan:
+        return self._cell(left), self._cell(top), self._cell(right), self._cell(bottom)
+
+    @staticmethod
+    def _cells_in(span: CellSpan) -> Iterator[Tuple[int, int]]:
+        left, top, right, bottom = span
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                yield cx, cy
+
+
+__all__ = ["GridIndex"]